@@ -23,10 +23,25 @@ MAX_ACTIVE_PLAYERS = 15
 # instead of default 1000ms. Higher CPU cost.
 LOW_LATENCY_MODE = False
 
+# Thread count for the parallel local video folder scan
+SCAN_MAX_WORKERS = 8
+
+# On-disk cache of local video folder listings
+SCAN_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "video-wall", "scan.sqlite")
+
+# Startup stream validation (HEAD probes)
+STREAM_PROBE_CONCURRENCY = 32
+STREAM_PROBE_TIMEOUT_S = 2
+# Longest startup waits for validation after the dialog before using all streams
+STREAM_VALIDATION_WAIT_S = 10
+
 # Timing configurations (milliseconds)
 ANIMATION_DURATION_MS = 8000
+TILE_FADE_DURATION_MS = 4000
 STREAM_CHECK_INTERVAL_MS = 30000
 VIDEO_LOADING_TIMEOUT_MS = 15000
+# Gap between successive stream starts when several tiles load at once
+STREAM_START_STAGGER_MS = 100
 
 # Resource paths — PyInstaller-aware via sys._MEIPASS
 if hasattr(sys, "_MEIPASS"):
@@ -2,13 +2,52 @@
 Animation controller for VideoWall tiles.
 """
 
+import functools
+import logging
 import random
-
-from PyQt5.QtCore import QEasingCurve, QObject, QPropertyAnimation, QRect, QTimer
+from contextlib import contextmanager
+from itertools import accumulate
+
+from PyQt5.QtCore import (
+    QAbstractAnimation,
+    QEasingCurve,
+    QObject,
+    QPropertyAnimation,
+    QRect,
+    Qt,
+    QTimer,
+    QVariantAnimation,
+)
 from PyQt5.QtMultimedia import QMediaPlayer
+from PyQt5.QtWidgets import QGraphicsOpacityEffect
+
+from src.config.settings import ANIMATION_DURATION_MS, TILE_FADE_DURATION_MS
+from src.utils.layout_utils import batched_layout_updates
+
+logger = logging.getLogger(__name__)
+
+# Transition types and their base probabilities (must sum to 1.0).
+# Heavily favor resize operations to ensure layouts change.
+_TRANSITION_LABELS = ("swap", "resize", "full_screen", "refresh")
+_TRANSITION_WEIGHTS = (
+    0.10,  # swap - simple tile swap
+    0.90,  # resize - reorganize tiles in new layout
+    0.0,  # full_screen - disabled (violates min 6 tiles)
+    0.0,  # refresh - refresh videos (disabled)
+)
+
+# Opacity a moving tile dips to before fading back in (matches the old rgba alpha 200)
+_FADE_OPACITY = 200 / 255
 
-from src.config.settings import ANIMATION_DURATION_MS
-from src.ui.theme import get_video_tile_fade_stylesheet, get_video_tile_stylesheet
+# The gentlest easing curves for slow, relaxed movement, built once and reused
+_EASING_CURVES = (
+    QEasingCurve(QEasingCurve.InOutSine),  # Very gentle sine wave motion
+    QEasingCurve(QEasingCurve.OutCubic),  # Smooth deceleration - less bouncy
+    QEasingCurve(QEasingCurve.InOutQuad),  # Smooth acceleration/deceleration
+)
+
+# Upper bound on memoized cell rectangles; oldest entries are evicted first
+_RECT_CACHE_SIZE = 64
 
 
 class TileAnimator(QObject):
@@ -35,16 +74,53 @@ class TileAnimator(QObject):
         self.grid_rows = grid_rows
         self.grid_cols = grid_cols
         self.parent_window = parent_window
-        self.animations = {}
+        # Precompute tile -> index map to avoid O(n) tiles.index() scans
+        self._tile_index = {id(t): i for i, t in enumerate(self.tiles)}
+        # One animation drives every moving tile; targets are
+        # (tile, (x, y, w, h) start, (dx, dy, dw, dh) delta)
+        self._batch_targets = []
+        self._batch_anim = QVariantAnimation(self)
+        self._batch_anim.setDuration(ANIMATION_DURATION_MS)
+        self._batch_anim.setStartValue(0.0)
+        self._batch_anim.setEndValue(1.0)
+        self._batch_anim.valueChanged.connect(self._apply_frame)
+        self._batch_anim.finished.connect(self.animation_finished)
+        # tile -> running fade-in animation; the opacity effect it drives is only
+        # installed while the fade runs, since effects force offscreen rendering
+        self._fade_anims = {}
         self.full_screen_tile = None
         self.last_transitions = []
         self.upcoming_transition_type = "resize"  # Initial transition type
+        # (row, col, row_span, col_span, width, height, rows, cols) -> QRect
+        self._rect_cache = {}
+        # frozenset(last_transitions) -> cumulative weights for random.choices
+        self._weight_cache = {}
 
         self.random_timer = QTimer(self)
+        # Intervals are whole seconds; let Qt batch the wake-up with other timers
+        self.random_timer.setTimerType(Qt.VeryCoarseTimer)
         self.random_timer.timeout.connect(self.trigger_random_action)
-        print("Animator initialized. Starting random interval timer.")
+        logger.debug("Animator initialized. Starting random interval timer.")
         self.start_random_timer()
 
+    @contextmanager
+    def _batch_layout(self):
+        """
+        Context manager that coalesces grid mutations into one layout + paint pass.
+
+        Re-activating the layout would snap tiles that are still mid-transition to
+        their layout cells, so those tiles get their current geometry back afterwards
+        and the running animation carries on from there.
+        """
+        in_flight = [(tile, tile.geometry()) for tile, _, _ in self._batch_targets]
+        with batched_layout_updates(self.layout.parentWidget(), self.layout):
+            yield
+        # Skip tiles whose transition was stopped inside the block (e.g. by a refresh)
+        still_moving = {id(tile) for tile, _, _ in self._batch_targets}
+        for tile, geom in in_flight:
+            if id(tile) in still_moving:
+                tile.setGeometry(geom)
+
     def get_tile_position(self, tile):
         """
         Attempts to find the grid row and column of a given tile widget.
@@ -56,24 +132,25 @@ class TileAnimator(QObject):
             tuple: (row, col) position tuple, or None if not found
         """
         try:
-            if tile and self.layout and tile.parentWidget():
-                idx = self.layout.indexOf(tile)
-                if idx != -1:
-                    row, col, _, _ = self.layout.getItemPosition(idx)
-                    return row, col
-                else:
-                    return None
-            else:
+            if not tile or not self.layout:
                 return None
+            # indexOf() already returns -1 for detached tiles, no parentWidget() needed
+            idx = self.layout.indexOf(tile)
+            if idx == -1:
+                return None
+            row, col, _, _ = self.layout.getItemPosition(idx)
+            return row, col
         except Exception as e:
-            print(f"Error getting tile position for {getattr(tile, 'tile_id', 'N/A')}: {e}")
+            logger.error(
+                "Error getting tile position for %s: %s", getattr(tile, "tile_id", "N/A"), e
+            )
             return None
 
     def trigger_random_action(self):
         """Executes transitions based on pre-selected transition type for variety."""
         # If we're in full-screen mode, always revert first
         if self.full_screen_tile:
-            print("Animator: Reverting from full-screen mode")
+            logger.debug("Animator: Reverting from full-screen mode")
             self.revert_from_full_screen()
         else:
             # Use the pre-selected transition type from previous timer
@@ -81,16 +158,16 @@ class TileAnimator(QObject):
 
             # Execute the selected transition
             if transition_type == "swap":
-                print("Animator: Triggering Tile Swap")
+                logger.debug("Animator: Triggering Tile Swap")
                 self.trigger_random_swap()
             elif transition_type == "full_screen":
-                print("Animator: Triggering Full-Screen Takeover")
+                logger.debug("Animator: Triggering Full-Screen Takeover")
                 self.trigger_full_screen_takeover()
             elif transition_type == "resize":
-                print("Animator: Triggering Tile Resize")
+                logger.debug("Animator: Triggering Tile Resize")
                 self.parent_window.refresh_all_videos()
             elif transition_type == "refresh":
-                print("Animator: Triggering Full Video Refresh")
+                logger.debug("Animator: Triggering Full Video Refresh")
                 if self.parent_window:
                     self.parent_window.refresh_all_videos()
 
@@ -104,13 +181,13 @@ class TileAnimator(QObject):
 
         valid_tiles = [t for t in self.tiles if t and t.parentWidget()]
         if len(valid_tiles) < 2:
-            print(f"Animator: Not enough valid tiles ({len(valid_tiles)}) to perform swap.")
+            logger.debug("Animator: Not enough valid tiles (%d) to perform swap.", len(valid_tiles))
             return
 
         try:
             tile1, tile2 = random.sample(valid_tiles, 2)
         except ValueError:
-            print("Animator: Error sampling tiles for swap.")
+            logger.warning("Animator: Error sampling tiles for swap.")
             return
 
         pos1 = self.get_tile_position(tile1)
@@ -119,13 +196,21 @@ class TileAnimator(QObject):
         if pos1 and pos2:
             row1, col1 = pos1
             row2, col2 = pos2
-            print(
-                f"Animator: Swapping Tile {tile1.tile_id} ({row1},{col1}) with Tile {tile2.tile_id} ({row2},{col2})"
+            logger.debug(
+                "Animator: Swapping Tile %s (%d,%d) with Tile %s (%d,%d)",
+                tile1.tile_id,
+                row1,
+                col1,
+                tile2.tile_id,
+                row2,
+                col2,
             )
             self.animate_swap(tile1, tile2, row1, col1, row2, col2)
         else:
-            print(
-                f"Animator: Failed to get positions for swap (Pos1: {pos1}, Pos2: {pos2}). Aborting swap."
+            logger.warning(
+                "Animator: Failed to get positions for swap (Pos1: %s, Pos2: %s). Aborting swap.",
+                pos1,
+                pos2,
             )
 
     def start_random_timer(self):
@@ -133,7 +218,7 @@ class TileAnimator(QObject):
         # Quick rotation intervals - 5, 15, 30 seconds
         possible_intervals_ms = [5000, 15000, 30000]
         interval_ms = random.choice(possible_intervals_ms)
-        print(f"Animator: Next random action in {interval_ms / 1000} seconds.")
+        logger.debug("Animator: Next random action in %s seconds.", interval_ms / 1000)
 
         # Save last few transitions to prevent getting stuck in a pattern
         if not hasattr(self, "last_transitions"):
@@ -152,51 +237,32 @@ class TileAnimator(QObject):
             self.random_timer.stop()
 
         # Add a debug message to ensure timer is being set up correctly
-        print(
-            f"Setting timer for next transition '{self.upcoming_transition_type}' in {interval_ms/1000} seconds"
+        logger.debug(
+            "Setting timer for next transition '%s' in %s seconds",
+            self.upcoming_transition_type,
+            interval_ms / 1000,
         )
         self.random_timer.start(interval_ms)
 
     def choose_next_transition(self):
-        """Choose the next transition type, with updated weights to ensure layout changes happen."""
-        # Define transition types with their probabilities (must sum to 1.0)
-        # Heavily favor resize operations to ensure layouts change
-        transition_weights = {
-            "swap": 0.10,  # 10% chance - simple tile swap
-            "resize": 0.90,  # 90% chance - reorganize tiles in new layout
-            "full_screen": 0.0,  # 0% chance - disabled (violates min 6 tiles)
-            "refresh": 0.0,  # 0% chance - refresh videos (disabled)
-        }
-
-        # Build a weighted list of transitions, excluding recent ones
-        available_transitions = {}
-
-        # If we have a history of transitions, lower the weight of recent ones
-        if hasattr(self, "last_transitions") and self.last_transitions:
-            # Copy weights but reduce probability of recent transitions by 80%
-            for t_type, weight in transition_weights.items():
-                if t_type in self.last_transitions:
-                    available_transitions[t_type] = weight * 0.2  # 80% reduction
-                else:
-                    available_transitions[t_type] = weight
-        else:
-            # No history yet, use original weights
-            available_transitions = transition_weights.copy()
-
-        # Normalize weights to ensure they sum to 1.0
-        total_weight = sum(available_transitions.values())
-        normalized_transitions = {t: w / total_weight for t, w in available_transitions.items()}
+        """Choose the next transition type, with updated weights to ensure layouts change."""
+        recent = frozenset(self.last_transitions)
+        cum_weights = self._weight_cache.get(recent)
+        if cum_weights is None:
+            # Reduce probability of recent transitions by 80%
+            cum_weights = list(
+                accumulate(
+                    weight * 0.2 if t_type in recent else weight
+                    for t_type, weight in zip(_TRANSITION_LABELS, _TRANSITION_WEIGHTS)
+                )
+            )
+            self._weight_cache[recent] = cum_weights
 
-        # Select transition based on weighted probability
-        r = random.random()
-        cumulative = 0
-        for t_type, weight in normalized_transitions.items():
-            cumulative += weight
-            if r <= cumulative:
-                self.upcoming_transition_type = t_type
-                break
+        self.upcoming_transition_type = random.choices(
+            _TRANSITION_LABELS, cum_weights=cum_weights
+        )[0]
 
-        print(f"Next transition will be: {self.upcoming_transition_type}")
+        logger.debug("Next transition will be: %s", self.upcoming_transition_type)
 
     def animate_swap(self, tile1, tile2, row1, col1, row2, col2):
         """
@@ -214,86 +280,141 @@ class TileAnimator(QObject):
         target_rect2 = self.calculate_target_rect(row1, col1)
 
         if not tile1 or not tile1.parentWidget() or not tile2 or not tile2.parentWidget():
-            print("Warning: One or both tiles became invalid before initiating swap animation.")
+            logger.warning("One or both tiles became invalid before initiating swap animation.")
             return
 
         geom1 = tile1.geometry()
         geom2 = tile2.geometry()
 
-        self.layout.removeWidget(tile1)
-        self.layout.removeWidget(tile2)
+        with self._batch_layout():
+            self.layout.removeWidget(tile1)
+            self.layout.removeWidget(tile2)
 
-        self.layout.addWidget(tile1, row2, col2, 1, 1)
-        self.layout.addWidget(tile2, row1, col1, 1, 1)
+            self.layout.addWidget(tile1, row2, col2, 1, 1)
+            self.layout.addWidget(tile2, row1, col1, 1, 1)
 
-        if tile1 and tile1.parentWidget():
-            tile1.setGeometry(geom1)
-        if tile2 and tile2.parentWidget():
-            tile2.setGeometry(geom2)
+        # Both tiles were validated above and re-adding keeps them parented
+        tile1.setGeometry(geom1)
+        tile2.setGeometry(geom2)
 
-        self.start_animation(tile1, geom1, target_rect1)
-        self.start_animation(tile2, geom2, target_rect2)
+        self.start_animations([(tile1, geom1, target_rect1), (tile2, geom2, target_rect2)])
 
     def start_animation(self, tile, start_geom, end_rect):
         """
-        Creates and starts a geometry animation for a tile with dramatically slower transitions.
+        Creates and starts a geometry animation for a single tile.
 
         Args:
             tile (VideoTile): Tile to animate
             start_geom (QRect): Starting geometry
             end_rect (QRect): Ending geometry
         """
-        if not tile or not tile.parentWidget():
-            print(f"Warning: Attempted to animate invalid tile {getattr(tile, 'tile_id', 'N/A')}")
+        self.start_animations([(tile, start_geom, end_rect)])
+
+    def start_animations(self, targets):
+        """
+        Starts one shared geometry animation that moves every given tile.
+
+        Args:
+            targets (list): (tile, start_geom, end_rect) tuples to animate together
+        """
+        valid_targets = []
+        for tile, start_geom, end_rect in targets:
+            if not tile or not tile.parentWidget():
+                logger.warning(
+                    "Attempted to animate invalid tile %s", getattr(tile, "tile_id", "N/A")
+                )
+                continue
+            start = (start_geom.x(), start_geom.y(), start_geom.width(), start_geom.height())
+            delta = (
+                end_rect.x() - start[0],
+                end_rect.y() - start[1],
+                end_rect.width() - start[2],
+                end_rect.height() - start[3],
+            )
+            valid_targets.append((tile, start, delta))
+
+        if not valid_targets:
+            return
+        new_count = len(valid_targets)
+
+        # Restarting the shared animation would drop tiles still in flight; carry
+        # them over, heading from where they are now to their original end rect
+        if self._batch_anim.state() == QAbstractAnimation.Running:
+            restarted = {id(tile) for tile, _, _ in valid_targets}
+            for tile, start, delta in self._batch_targets:
+                if id(tile) in restarted:
+                    continue
+                geom = tile.geometry()
+                current = (geom.x(), geom.y(), geom.width(), geom.height())
+                valid_targets.append(
+                    (tile, current, tuple(s + d - c for s, d, c in zip(start, delta, current)))
+                )
+
+        self._batch_anim.stop()
+        self._batch_targets = valid_targets
+
+        self._batch_anim.setEasingCurve(random.choice(_EASING_CURVES))
+        self._batch_anim.start()
+
+        # Moderate fade effect for graceful transitions; carried-over tiles keep theirs
+        for tile, _, _ in valid_targets[:new_count]:
+            self._start_fade(tile)
+
+    def _start_fade(self, tile):
+        """
+        Dip a tile's opacity and fade it back in, installing an opacity effect for the fade.
+
+        Args:
+            tile (VideoTile): Tile to fade
+        """
+        fade = self._fade_anims.get(tile)
+        if fade is None:
+            effect = QGraphicsOpacityEffect(tile)
+            tile.setGraphicsEffect(effect)
+            fade = QPropertyAnimation(effect, b"opacity", self)
+            fade.setDuration(TILE_FADE_DURATION_MS)
+            fade.setStartValue(_FADE_OPACITY)
+            fade.setEndValue(1.0)
+            fade.finished.connect(functools.partial(self._end_fade, tile))
+            self._fade_anims[tile] = fade
+        else:
+            fade.stop()
+        fade.start()
+
+    def _end_fade(self, tile):
+        """
+        Stop a tile's fade and remove its opacity effect.
+
+        Args:
+            tile (VideoTile): Tile whose fade is over
+        """
+        fade = self._fade_anims.pop(tile, None)
+        if fade is None:
             return
+        fade.stop()
+        # Qt deletes the removed effect, so the animation targeting it goes too
+        tile.setGraphicsEffect(None)
+        fade.deleteLater()
 
-        if tile in self.animations:
-            old_anim = self.animations[tile]
-            old_anim.stop()
-            # Cancel pending stylesheet revert timer to avoid visual glitch
-            if hasattr(old_anim, '_stylesheet_timer'):
-                old_anim._stylesheet_timer.stop()
-                delattr(old_anim, '_stylesheet_timer')
-
-        # Create the geometry animation
-        animation = QPropertyAnimation(tile, b"geometry", self)
-
-        # Set a more moderate duration for animations
-        animation.setDuration(ANIMATION_DURATION_MS)  # 8 seconds for smooth transitions
-        animation.setStartValue(start_geom)
-        animation.setEndValue(end_rect)
-
-        # Choose the gentlest easing curves for slow, relaxed movement
-        easing_curves = [
-            QEasingCurve.InOutSine,  # Very gentle sine wave motion
-            QEasingCurve.OutCubic,  # Smooth deceleration - less bouncy
-            QEasingCurve.InOutQuad,  # Smooth acceleration/deceleration
-        ]
-        animation.setEasingCurve(random.choice(easing_curves))
-
-        animation.finished.connect(lambda t=tile: self.animation_finished(t))
-
-        animation.start(QPropertyAnimation.DeleteWhenStopped)
-
-        self.animations[tile] = animation
-
-        # Moderate fade effect for graceful transitions
-        tile.setStyleSheet(get_video_tile_fade_stylesheet())
-        stylesheet_timer = QTimer(self)
-        stylesheet_timer.setSingleShot(True)
-        stylesheet_timer.timeout.connect(lambda: tile.setStyleSheet(get_video_tile_stylesheet()))
-        stylesheet_timer.start(4000)
-        animation._stylesheet_timer = stylesheet_timer
-
-    def animation_finished(self, tile):
+    def _apply_frame(self, progress):
         """
-        Callback function when an animation completes.
+        Interpolates and applies geometry for every tile in the running batch.
 
         Args:
-            tile (VideoTile): Tile whose animation has completed
+            progress (float): Eased animation progress from 0.0 to 1.0
         """
-        if tile in self.animations:
-            del self.animations[tile]
+        # Targets were validated when the batch started; skip per-frame parent checks
+        for tile, (x, y, w, h), (dx, dy, dw, dh) in self._batch_targets:
+            tile.setGeometry(
+                int(x + dx * progress),
+                int(y + dy * progress),
+                int(w + dw * progress),
+                int(h + dh * progress),
+            )
+
+    def animation_finished(self):
+        """Callback function when the batch animation completes."""
+        self._batch_targets = []
 
     def calculate_target_rect(self, row, col, row_span=1, col_span=1):
         """
@@ -311,42 +432,56 @@ class TileAnimator(QObject):
         grid_widget = self.layout.parentWidget()
         if not grid_widget:
             return QRect()
-        parent_width = grid_widget.width()
-        parent_height = grid_widget.height()
         if self.grid_cols <= 0 or self.grid_rows <= 0:
             return QRect()
 
-        cell_width = parent_width / self.grid_cols
-        cell_height = parent_height / self.grid_rows
-        target_x = col * cell_width
-        target_y = row * cell_height
-        target_width = cell_width * col_span
-        target_height = cell_height * row_span
+        width = grid_widget.width()
+        height = grid_widget.height()
+        key = (row, col, row_span, col_span, width, height, self.grid_rows, self.grid_cols)
+        rect = self._rect_cache.get(key)
+        if rect is None:
+            cell_width = width / self.grid_cols
+            cell_height = height / self.grid_rows
+            rect = QRect(
+                int(col * cell_width),
+                int(row * cell_height),
+                int(cell_width * col_span),
+                int(cell_height * row_span),
+            )
+            if len(self._rect_cache) >= _RECT_CACHE_SIZE:
+                self._rect_cache.pop(next(iter(self._rect_cache)))
+            self._rect_cache[key] = rect
+
+        return QRect(rect)
 
-        return QRect(int(target_x), int(target_y), int(target_width), int(target_height))
+    def invalidate_geometry_cache(self):
+        """Drop memoized cell rectangles; called when the parent window is resized."""
+        self._rect_cache.clear()
 
     def trigger_full_screen_takeover(self):
         """Selects a random tile to take over the entire screen."""
         valid_tiles = [t for t in self.tiles if t and t.parentWidget()]
         if not valid_tiles:
-            print("Animator: No valid tiles for full-screen takeover.")
+            logger.debug("Animator: No valid tiles for full-screen takeover.")
             return
 
         self.parent_window.video_manager.pause_all_players()
 
-        for tile in self.tiles:
-            if tile and tile.parentWidget():
+        self.full_screen_tile = random.choice(valid_tiles)
+        with self._batch_layout():
+            # Leave the chosen tile shown so its video surface is not torn down
+            for tile in valid_tiles:
                 self.layout.removeWidget(tile)
-                tile.hide()
+                if tile is not self.full_screen_tile:
+                    tile.hide()
 
-        self.full_screen_tile = random.choice(valid_tiles)
-        self.layout.addWidget(self.full_screen_tile, 0, 0, self.grid_rows, self.grid_cols)
-        self.full_screen_tile.show()
+            self.layout.addWidget(self.full_screen_tile, 0, 0, self.grid_rows, self.grid_cols)
+            self.full_screen_tile.show()
         target_rect = self.calculate_target_rect(0, 0, self.grid_rows, self.grid_cols)
         self.start_animation(self.full_screen_tile, self.full_screen_tile.geometry(), target_rect)
-        print(f"Tile {self.full_screen_tile.tile_id} taking over full screen")
+        logger.debug("Tile %s taking over full screen", self.full_screen_tile.tile_id)
 
-        tile_index = self.tiles.index(self.full_screen_tile)
+        tile_index = self._tile_index[id(self.full_screen_tile)]
         player = self.parent_window.video_manager.players[tile_index]
         if player and player.state() != QMediaPlayer.PlayingState:
             player.play()
@@ -359,18 +494,19 @@ class TileAnimator(QObject):
         if not self.full_screen_tile:
             return
 
-        self.layout.removeWidget(self.full_screen_tile)
-        self.full_screen_tile.hide()
-        self.full_screen_tile = None
+        with self._batch_layout():
+            # The layout refresh below decides whether this tile stays visible
+            self.layout.removeWidget(self.full_screen_tile)
+            self.full_screen_tile = None
 
-        # Trigger a full layout refresh
-        self.parent_window.refresh_all_videos()
+            # Trigger a full layout refresh
+            self.parent_window.refresh_all_videos()
 
     def stop_timers_and_animations(self):
         """Stops the main timer and all currently running animations."""
-        print("Animator: Stopping timer and animations...")
+        logger.debug("Animator: Stopping timer and animations...")
         self.random_timer.stop()
-        for tile in list(self.animations.keys()):
-            if tile in self.animations:
-                self.animations[tile].stop()
-        self.animations.clear()
+        self._batch_anim.stop()
+        self._batch_targets = []
+        for tile in list(self._fade_anims):
+            self._end_fade(tile)
@@ -3,18 +3,26 @@ Main application entry point.
 """
 
 import argparse
+import concurrent.futures
+import logging
 import os
 import platform
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from PyQt5.QtGui import QFont, QIcon
 from PyQt5.QtWidgets import QApplication
 
-from src.config.settings import ICON_PATH
+from src.config.settings import ICON_PATH, STREAM_VALIDATION_WAIT_S
 from src.core.video_wall import VideoWall
 from src.ui.dialogs import LocalVideoDialog
 from src.ui.theme import get_app_stylesheet
-from src.utils.file_utils import get_all_m3u8_links, get_video_files_recursively
+from src.utils.file_utils import get_all_m3u8_links
+from src.utils.log_utils import setup_logging
+from src.utils.stream_utils import validate_urls
+
+logger = logging.getLogger(__name__)
 
 # Get the base path for bundled data
 if hasattr(sys, "_MEIPASS"):
@@ -48,8 +56,15 @@ def main():
         action="store_true",
         help="Enable hardware acceleration (default: CPU only)",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore the cached folder listing and rescan local videos",
+    )
     args, qt_args = parser.parse_known_args()
 
+    setup_logging(logging.INFO)
+
     # Store HWA setting globally
     os.environ["VIDEOWALL_HWA_ENABLED"] = "1" if args.hwa_enabled else "0"
 
@@ -74,40 +89,88 @@ def main():
 
     # Debug output
     if m3u8_links:
-        print(f"Loaded {len(m3u8_links)} M3U8 streams from {m3u8_path}")
+        logger.info("Loaded %d M3U8 streams from %s", len(m3u8_links), m3u8_path)
         for i, link in enumerate(m3u8_links[:3], 1):
-            print(f"  Stream {i}: {link[:60]}...")
+            logger.debug("  Stream %d: %.60s...", i, link)
     else:
-        print(f"No M3U8 streams loaded from {m3u8_path}")
+        logger.info("No M3U8 streams loaded from %s", m3u8_path)
+
+    # Probe streams only once the user opts into testing; starting as soon as the
+    # skip box is unchecked still overlaps the probes with the rest of the dialog
+    validation_executor = ThreadPoolExecutor(max_workers=1)
+    # Set when the result is abandoned, so probes not yet sent return at once
+    # and the interpreter is not held up at exit
+    validation_stop = threading.Event()
+    validation = None
+
+    def start_validation(skip):
+        nonlocal validation
+        if not skip and validation is None and m3u8_links:
+            validation = validation_executor.submit(
+                validate_urls, m3u8_links, stop_event=validation_stop
+            )
+
+    def abandon_validation():
+        validation_stop.set()
+        if validation is not None:
+            validation.cancel()
+        validation_executor.shutdown(wait=False)
 
     # Show configuration dialog
     dialog = LocalVideoDialog()
+    dialog.skip_stream_testing.toggled.connect(start_validation)
     result = dialog.exec_()
 
     if result == 0:  # User canceled
+        abandon_validation()
         return 0
 
     config = dialog.get_results()
 
-    # Get local videos if enabled
-    local_videos = []
-    if config["use_local_videos"] and config["folder_path"]:
-        local_videos = get_video_files_recursively(config["folder_path"])
+    # Drop unreachable streams unless the user opted out
+    if config["skip_stream_testing"]:
+        # Possibly unchecked and re-checked during the dialog; the result is not wanted
+        abandon_validation()
+    else:
+        start_validation(False)
+        validation_executor.shutdown(wait=False)
+        if validation is not None:
+            try:
+                reachable = validation.result(timeout=STREAM_VALIDATION_WAIT_S)
+            except concurrent.futures.TimeoutError:
+                abandon_validation()
+                logger.warning(
+                    "Stream validation took over %ss, using all streams", STREAM_VALIDATION_WAIT_S
+                )
+            except Exception as e:
+                logger.warning("Stream validation failed, using all streams: %s", e)
+            else:
+                if reachable:
+                    m3u8_links = reachable
+                else:
+                    # Usually a network outage rather than a wholly dead playlist
+                    logger.warning("No streams passed validation, using all streams")
 
     # Print HWA status
     if args.hwa_enabled:
-        print("Hardware acceleration: ENABLED")
+        logger.info("Hardware acceleration: ENABLED")
     else:
-        print("Hardware acceleration: DISABLED (CPU only)")
+        logger.info("Hardware acceleration: DISABLED (CPU only)")
 
     # Create video wall for each screen
     screens = app.screens()
     video_walls = []
 
+    local_folder = config["folder_path"] if config["use_local_videos"] else None
     for screen in screens:
-        wall = VideoWall(app, m3u8_links, local_videos, screen)
+        wall = VideoWall(app, m3u8_links, [], screen, local_folder, video_walls)
         video_walls.append(wall)
 
+    # Scan local videos off the GUI thread; walls start on streams and
+    # back-fill idle tiles once the scan delivers its results
+    if local_folder and video_walls:
+        video_walls[0].start_folder_scan(refresh=args.refresh)
+
     # Auto-start recording if checkbox was checked
     if config.get("record_streams", False):
         from PyQt5.QtCore import QTimer
@@ -2,6 +2,8 @@
 Display manager for VideoWall.
 """
 
+import itertools
+
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QGridLayout, QWidget
 
@@ -90,13 +92,10 @@ class DisplayManager:
         if len(self.tiles) != num_tiles:
             self.create_tiles(num_tiles)
 
-        # Add tiles to grid
-        tile_index = 0
-        for row in range(self.grid_rows):
-            for col in range(self.grid_cols):
-                if tile_index < len(self.tiles):
-                    self.grid_layout.addWidget(self.tiles[tile_index], row, col)
-                    tile_index += 1
+        # Add tiles to grid in row-major order
+        cells = itertools.product(range(self.grid_rows), range(self.grid_cols))
+        for tile, (row, col) in zip(self.tiles, cells):
+            self.grid_layout.addWidget(tile, row, col)
 
         # Create animator if requested
         if animator:
@@ -0,0 +1,46 @@
+"""
+Background local-video folder scanning for VideoWall.
+"""
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from src.utils.file_utils import get_video_files_recursively
+
+
+class FolderScanSignals(QObject):
+    """
+    Signals emitted by FolderScanWorker.
+
+    QRunnable is not a QObject, so the worker carries its signals here.
+    """
+
+    finished = pyqtSignal(list)
+
+
+class FolderScanWorker(QRunnable):
+    """
+    Scans a folder for video files on a QThreadPool thread.
+
+    Connect receivers to signals.finished before starting the worker; the
+    list is delivered to QObject receivers on their own (GUI) thread.
+    """
+
+    def __init__(self, folder_path, refresh=False):
+        """
+        Initialize the worker.
+
+        Args:
+            folder_path (str): Folder to scan for video files
+            refresh (bool, optional): Ignore cached listings and re-read every directory
+        """
+        super().__init__()
+        self.folder_path = folder_path
+        self.refresh = refresh
+        self.signals = FolderScanSignals()
+
+    def run(self):
+        """Scan the folder and emit the video file paths found."""
+        # get_video_files_recursively logs and returns [] on failure
+        self.signals.finished.emit(
+            get_video_files_recursively(self.folder_path, refresh=self.refresh)
+        )
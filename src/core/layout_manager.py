@@ -2,9 +2,26 @@
 Layout management for the VideoWall application.
 """
 
+import logging
 import random
 
 from src.config.settings import MAX_VISIBLE_TILES, MIN_VISIBLE_TILES
+from src.utils.layout_utils import batched_layout_updates
+
+logger = logging.getLogger(__name__)
+
+_LAYOUT_PATTERNS = ("varied", "feature", "columns", "rows", "mixed", "asymmetric")
+
+# (row_span, col_span) choices per pattern, all capped at 2x2 max to ensure
+# 6-12 visible tiles. Repeated entries weight the random choice.
+_PATTERN_SIZES = {
+    "varied": ((2, 2), (1, 2), (2, 1), (1, 1), (1, 1), (1, 1)),
+    "feature": ((2, 2), (1, 2), (2, 1), (1, 1)),
+    "columns": ((2, 1), (1, 1), (1, 1)),
+    "rows": ((1, 2), (1, 1), (1, 1)),
+    "mixed": ((2, 2), (1, 2), (2, 1), (1, 1)),
+    "asymmetric": ((2, 2), (2, 1), (1, 2), (1, 1)),
+}
 
 
 class LayoutManager:
@@ -16,12 +33,40 @@ class LayoutManager:
     def __init__(self, display_manager):
         self.display_manager = display_manager
         self.grid_layout = display_manager.grid_layout
+        self.central_widget = display_manager.central_widget
         self.grid_rows = display_manager.grid_rows
         self.grid_cols = display_manager.grid_cols
         self.tiles = display_manager.tiles
         self.current_layout = [(1, 1)] * len(self.tiles)
-        self.occupied_cells = None
+        # Occupied grid cells as a flat bitmask; bit (row * grid_cols + col) is set when
+        # taken. Resetting is a single int assignment, with no per-row allocation.
+        self.occupied_cells = 0
+        self._cell_count = self.grid_rows * self.grid_cols
+        # (row, col) of each flat cell position, in row-major order
+        self._cell_coords = tuple(divmod(pos, self.grid_cols) for pos in range(self._cell_count))
+        # Indices of tiles placed by the current layout attempt. Visibility is only
+        # synced once the final layout is known, so tiles that stay on screen are
+        # never hidden and re-shown (which would unmap and remap their video surface).
+        self._placed = set()
         # Precompute tile -> index map to avoid O(n) lookups
+        self._tile_index = {}
+        self._reindex()
+        # Precompute the cell bitmask of every in-bounds (row, col, row_span, col_span)
+        # placement, so a fit test or mark is one dict lookup and one AND/OR
+        self._placement_masks = {}
+        for row_span in range(1, self.grid_rows + 1):
+            for col_span in range(1, self.grid_cols + 1):
+                shape = sum(
+                    1 << (r * self.grid_cols + c) for r in range(row_span) for c in range(col_span)
+                )
+                for row in range(self.grid_rows - row_span + 1):
+                    for col in range(self.grid_cols - col_span + 1):
+                        self._placement_masks[(row, col, row_span, col_span)] = shape << (
+                            row * self.grid_cols + col
+                        )
+
+    def _reindex(self):
+        """Rebuild the tile -> index map; call after tiles are added or replaced."""
         self._tile_index = {id(t): i for i, t in enumerate(self.tiles)}
 
     def apply_random_layout(self):
@@ -29,41 +74,48 @@ class LayoutManager:
         Apply a random layout pattern to the grid.
         Retries until visible tile count is within MIN/MAX bounds.
         """
+        # Suspend repaints while tiles are removed and re-added so Qt coalesces
+        # the per-widget relayouts into a single layout + paint pass
+        with batched_layout_updates(self.central_widget, self.grid_layout):
+            pattern = self._apply_random_layout()
+            self._sync_visibility()
+        return pattern
+
+    def _apply_random_layout(self):
+        """Run layout attempts until one satisfies the visible tile bounds."""
         max_attempts = 5
         for attempt in range(max_attempts):
             pattern = self._try_layout()
             visible = self._count_visible_tiles()
 
             if MIN_VISIBLE_TILES <= visible <= MAX_VISIBLE_TILES:
-                print(f"Layout '{pattern}': {visible} visible tiles (attempt {attempt + 1})")
+                logger.debug(
+                    "Layout '%s': %d visible tiles (attempt %d)", pattern, visible, attempt + 1
+                )
                 return pattern
             else:
-                print(
-                    f"Layout '{pattern}' produced {visible} tiles (need {MIN_VISIBLE_TILES}-{MAX_VISIBLE_TILES}), retrying..."
+                logger.debug(
+                    "Layout '%s' produced %d tiles (need %d-%d), retrying...",
+                    pattern,
+                    visible,
+                    MIN_VISIBLE_TILES,
+                    MAX_VISIBLE_TILES,
                 )
 
         # Fallback: force a clean grid of 1x1 tiles, showing exactly MAX_VISIBLE_TILES
         self._apply_fallback_grid()
         visible = self._count_visible_tiles()
-        print(f"Fallback grid: {visible} visible tiles")
+        logger.debug("Fallback grid: %d visible tiles", visible)
         return "fallback_grid"
 
     def _try_layout(self):
         """Attempt a single random layout. Returns the pattern name."""
-        layout_patterns = ["varied", "feature", "columns", "rows", "mixed", "asymmetric"]
-        pattern = random.choice(layout_patterns)
+        pattern = random.choice(_LAYOUT_PATTERNS)
 
-        # Remove all tiles from the layout
-        for tile in self.tiles:
-            if tile and tile.parentWidget():
-                self.grid_layout.removeWidget(tile)
-                tile.hide()
-
-        # Initialize tracking of occupied cells
-        self.occupied_cells = [[False] * self.grid_cols for _ in range(self.grid_rows)]
+        self._clear_grid()
 
         # Get tile sizes for this pattern (all capped at 2x2 max)
-        possible_sizes = self._get_possible_sizes(pattern)
+        possible_sizes = _PATTERN_SIZES[pattern]
 
         if pattern == "feature":
             self._apply_feature_layout(possible_sizes)
@@ -73,52 +125,43 @@ class LayoutManager:
         return pattern
 
     def _count_visible_tiles(self):
-        """Count how many tiles are currently visible."""
-        return sum(1 for t in self.tiles if t and t.isVisible())
+        """Count how many tiles the current layout attempt will show."""
+        return len(self._placed)
 
-    def _apply_fallback_grid(self):
-        """Force a clean grid with exactly MAX_VISIBLE_TILES as 1x1."""
+    def _clear_grid(self):
+        """Remove all tiles from the layout and reset placement tracking."""
         for tile in self.tiles:
             if tile and tile.parentWidget():
                 self.grid_layout.removeWidget(tile)
-                tile.hide()
 
-        self.occupied_cells = [[False] * self.grid_cols for _ in range(self.grid_rows)]
+        self.occupied_cells = 0
+        self._placed.clear()
 
-        tiles_to_place = self.tiles.copy()
-        random.shuffle(tiles_to_place)
-        placed = 0
-
-        for row in range(self.grid_rows):
-            for col in range(self.grid_cols):
-                if placed >= MAX_VISIBLE_TILES or placed >= len(tiles_to_place):
-                    break
-                tile = tiles_to_place[placed]
-                self.grid_layout.addWidget(tile, row, col, 1, 1)
-                tile.show()
-                self.current_layout[self._tile_index[id(tile)]] = (1, 1)
-                self.occupied_cells[row][col] = True
-                placed += 1
-            if placed >= MAX_VISIBLE_TILES:
-                break
+    def _place_tile(self, tile, row, col, row_span, col_span):
+        """Add a tile to the grid at the given position and record it as placed."""
+        self._mark_occupied(row, col, row_span, col_span)
+        self.grid_layout.addWidget(tile, row, col, row_span, col_span)
+        index = self._tile_index[id(tile)]
+        self.current_layout[index] = (row_span, col_span)
+        self._placed.add(index)
 
-    def _get_possible_sizes(self, pattern):
-        """
-        Get possible tile sizes based on the layout pattern.
-        All sizes capped at 2x2 max to ensure 6-12 visible tiles.
-        """
-        if pattern == "varied":
-            return [(2, 2), (1, 2), (2, 1), (1, 1), (1, 1), (1, 1)]
-        elif pattern == "feature":
-            return [(2, 2), (1, 2), (2, 1), (1, 1)]
-        elif pattern == "columns":
-            return [(2, 1), (1, 1), (1, 1)]
-        elif pattern == "rows":
-            return [(1, 2), (1, 1), (1, 1)]
-        elif pattern == "mixed":
-            return [(2, 2), (1, 2), (2, 1), (1, 1)]
-        else:  # asymmetric
-            return [(2, 2), (2, 1), (1, 2), (1, 1)]
+    def _sync_visibility(self):
+        """Show placed tiles and hide the rest; already-correct tiles are untouched."""
+        placed = self._placed
+        for index, tile in enumerate(self.tiles):
+            if tile:
+                tile.setVisible(index in placed)
+
+    def _apply_fallback_grid(self):
+        """Force a clean grid with exactly MAX_VISIBLE_TILES as 1x1."""
+        self._clear_grid()
+
+        # Only MAX_VISIBLE_TILES are placed, so draw just those
+        count = min(MAX_VISIBLE_TILES, len(self.tiles), self._cell_count)
+        tiles_to_place = random.sample(self.tiles, count)
+
+        for tile, (row, col) in zip(tiles_to_place, self._cell_coords):
+            self._place_tile(tile, row, col, 1, 1)
 
     def _apply_feature_layout(self, possible_sizes):
         """Apply a layout with one prominent 2x2 feature tile."""
@@ -135,13 +178,7 @@ class LayoutManager:
             row = random.randint(0, max_row)
             col = random.randint(0, max_col)
 
-            for r in range(row, row + row_span):
-                for c in range(col, col + col_span):
-                    self.occupied_cells[r][c] = True
-
-            self.grid_layout.addWidget(feature_tile, row, col, row_span, col_span)
-            feature_tile.show()
-            self.current_layout[self.tiles.index(feature_tile)] = (row_span, col_span)
+            self._place_tile(feature_tile, row, col, row_span, col_span)
             tiles_to_place.pop(0)
 
         self._place_remaining_tiles(tiles_to_place, possible_sizes)
@@ -165,20 +202,12 @@ class LayoutManager:
                 tile_idx += 1
                 continue
 
-            placed = False
-
             filtered_sizes = self._filter_sizes_that_fit(possible_sizes)
             if not filtered_sizes:
-                filtered_sizes = [(1, 1)]
-
-            preferred_size = random.choice(filtered_sizes)
-            placed = self._try_place_tile_with_size(tile, preferred_size)
+                filtered_sizes = ((1, 1),)
 
-            if not placed:
-                for size in filtered_sizes:
-                    if self._try_place_tile_with_size(tile, size):
-                        placed = True
-                        break
+            # Every filtered size fits somewhere, so a single attempt is enough
+            placed = self._try_place_tile_with_size(tile, random.choice(filtered_sizes))
 
             if placed:
                 visible_count += 1
@@ -191,55 +220,51 @@ class LayoutManager:
 
     def _filter_sizes_that_fit(self, possible_sizes):
         """Filter tile sizes that can fit in the remaining space."""
-        filtered_sizes = []
-        for row_span, col_span in possible_sizes:
-            for row in range(self.grid_rows - row_span + 1):
-                for col in range(self.grid_cols - col_span + 1):
-                    if self._check_fit(row, col, row_span, col_span):
-                        filtered_sizes.append((row_span, col_span))
-                        break
-                if (row_span, col_span) in filtered_sizes:
-                    break
-        return filtered_sizes
+        return [size for size in possible_sizes if self._find_fit(*size) is not None]
 
     def _check_fit(self, row, col, row_span, col_span):
         """Check if a tile of given size can fit at the specified position."""
-        if row + row_span > self.grid_rows or col + col_span > self.grid_cols:
-            return False
-        for r in range(row, row + row_span):
-            for c in range(col, col + col_span):
-                if self.occupied_cells[r][c]:
-                    return False
-        return True
+        mask = self._placement_masks.get((row, col, row_span, col_span))
+        return mask is not None and not self.occupied_cells & mask
+
+    def _mark_occupied(self, row, col, row_span, col_span):
+        """Mark the cells covered by a tile at the given position as occupied."""
+        self.occupied_cells |= self._placement_masks[(row, col, row_span, col_span)]
+
+    def _find_fit(self, row_span, col_span):
+        """Return the first free (row, col) where a tile of this size fits, or None."""
+        if row_span > self.grid_rows or col_span > self.grid_cols:
+            return None
+        occupied = self.occupied_cells
+        for pos in range(self._cell_count):
+            if occupied >> pos & 1:
+                continue
+            row, col = self._cell_coords[pos]
+            if self._check_fit(row, col, row_span, col_span):
+                return row, col
+        return None
 
     def _try_place_tile_with_size(self, tile, size):
         """Try to place a tile with the given size anywhere in the grid."""
         row_span, col_span = size
+        position = self._find_fit(row_span, col_span)
+        if position is None:
+            return False
 
-        for row in range(self.grid_rows - row_span + 1):
-            for col in range(self.grid_cols - col_span + 1):
-                if self._check_fit(row, col, row_span, col_span):
-                    for r in range(row, row + row_span):
-                        for c in range(col, col + col_span):
-                            self.occupied_cells[r][c] = True
-
-                    self.grid_layout.addWidget(tile, row, col, row_span, col_span)
-                    tile.show()
-                    self.current_layout[self._tile_index[id(tile)]] = (row_span, col_span)
-                    return True
-        return False
+        row, col = position
+        self._place_tile(tile, row, col, row_span, col_span)
+        return True
 
     def _fill_gaps(self, remaining_tiles, max_to_fill):
         """Fill remaining gaps with 1x1 tiles, up to max_to_fill."""
         remaining_tiles = [t for t in remaining_tiles if t]
         filled = 0
 
-        for row in range(self.grid_rows):
-            for col in range(self.grid_cols):
-                if not self.occupied_cells[row][col] and remaining_tiles and filled < max_to_fill:
-                    tile = remaining_tiles.pop(0)
-                    self.grid_layout.addWidget(tile, row, col, 1, 1)
-                    tile.show()
-                    self.current_layout[self._tile_index[id(tile)]] = (1, 1)
-                    self.occupied_cells[row][col] = True
-                    filled += 1
+        for pos in range(self._cell_count):
+            if not remaining_tiles or filled >= max_to_fill:
+                break
+            if self.occupied_cells >> pos & 1:
+                continue
+            row, col = self._cell_coords[pos]
+            self._place_tile(remaining_tiles.pop(0), row, col, 1, 1)
+            filled += 1
@@ -4,6 +4,7 @@ Captures the fullscreen video wall to MP4 files on the Desktop.
 Only available on Linux with X11 (not Wayland).
 """
 
+import logging
 import os
 import platform
 import signal
@@ -16,6 +17,8 @@ from PyQt5.QtWidgets import QLabel
 
 from src.ui.theme import RADIUS_SM, TEXT_HEADING
 
+logger = logging.getLogger(__name__)
+
 
 class RecordingIndicator(QLabel):
     """Red blinking REC dot overlay shown during recording."""
@@ -99,7 +102,7 @@ class ScreenRecorder:
             return
 
         if not self._is_x11_available():
-            print("Recording unavailable: requires Linux with X11 (not Wayland)")
+            logger.warning("Recording unavailable: requires Linux with X11 (not Wayland)")
             return
 
         # Get the window/screen geometry
@@ -119,7 +122,7 @@ class ScreenRecorder:
         h = h if h % 2 == 0 else h - 1
 
         if w <= 0 or h <= 0:
-            print(f"Recording skipped: invalid dimensions {w}x{h}")
+            logger.warning("Recording skipped: invalid dimensions %dx%d", w, h)
             return
 
         # Generate output filename
@@ -159,12 +162,12 @@ class ScreenRecorder:
             )
             self.is_recording = True
             self.indicator.start()
-            print(f"Recording started: {self.current_file}")
+            logger.info("Recording started: %s", self.current_file)
         except FileNotFoundError:
-            print("Recording unavailable: ffmpeg not found in PATH")
+            logger.warning("Recording unavailable: ffmpeg not found in PATH")
             self.is_recording = False
         except Exception as e:
-            print(f"Failed to start recording: {e}")
+            logger.error("Failed to start recording: %s", e)
             self.is_recording = False
 
     def stop(self):
@@ -194,7 +197,7 @@ class ScreenRecorder:
             except OSError:
                 pass
         except Exception as e:
-            print(f"Error stopping recording: {e}")
+            logger.error("Error stopping recording: %s", e)
             try:
                 if self.process:
                     self.process.kill()
@@ -204,7 +207,7 @@ class ScreenRecorder:
         self.is_recording = False
         self.process = None
         self.indicator.stop()
-        print(f"Recording saved: {self.current_file}")
+        logger.info("Recording saved: %s", self.current_file)
 
     def cleanup(self):
         """Stop recording if active. Call on app exit."""
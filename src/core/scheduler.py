@@ -0,0 +1,160 @@
+"""
+Shared deferred-callback scheduler for VideoWall.
+"""
+
+import functools
+import heapq
+import inspect
+import itertools
+import logging
+import time
+import weakref
+
+from PyQt5.QtCore import QTimer
+
+logger = logging.getLogger(__name__)
+
+
+def weak_callback(method, *args, **kwargs):
+    """
+    Wrap a bound method so a pending call does not keep its owner alive.
+
+    Arguments given here are bound first, like functools.partial; the wrapped
+    call becomes a no-op once the owner has been garbage collected.
+
+    Args:
+        method (callable): Bound method to call
+        *args: Positional arguments to bind
+        **kwargs: Keyword arguments to bind
+
+    Returns:
+        callable: Function forwarding any further arguments to the method
+    """
+    ref = weakref.WeakMethod(method)
+
+    def call(*more_args):
+        target = ref()
+        if target is not None:
+            return target(*args, *more_args, **kwargs)
+        return None
+
+    return call
+
+
+class ScheduledCall:
+    """
+    Handle for a callback queued on the Scheduler.
+    """
+
+    __slots__ = ("callback", "active")
+
+    def __init__(self, callback):
+        """
+        Initialize the handle.
+
+        Args:
+            callback (callable): Function to run when the call comes due
+        """
+        self.callback = callback
+        self.active = True
+
+    def stop(self):
+        """Cancel the call if it has not run yet (mirrors QTimer.stop)."""
+        self.active = False
+        # Drop the callback now so a cancelled entry waiting in the heap pins nothing
+        self.callback = None
+
+
+class Scheduler:
+    """
+    Runs deferred callbacks from a min-heap driven by a single QTimer.
+
+    Replaces one QTimer object or singleShot per retry/timeout with one timer
+    that is re-armed for the earliest pending deadline, so the event loop only
+    wakes when something is actually due.
+    """
+
+    def __init__(self):
+        """Initialize an empty scheduler."""
+        # (due_time, sequence, ScheduledCall); sequence keeps ordering stable
+        self._heap = []
+        self._sequence = itertools.count()
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_due)
+
+    def schedule(self, delay_ms, callback, *args):
+        """
+        Queue a callback to run after a delay.
+
+        Bound methods are held weakly, so a pending call never keeps a closed
+        window or its managers alive.
+
+        Args:
+            delay_ms (int): Delay in milliseconds
+            callback (callable): Function to call
+            *args: Arguments to pass to the callback
+
+        Returns:
+            ScheduledCall: Handle that can cancel the call
+        """
+        if inspect.ismethod(callback):
+            callback = weak_callback(callback, *args)
+        elif args:
+            callback = functools.partial(callback, *args)
+        call = ScheduledCall(callback)
+        due = time.monotonic() + delay_ms / 1000
+        heapq.heappush(self._heap, (due, next(self._sequence), call))
+        if self._heap[0][2] is call:
+            self._arm()
+        return call
+
+    def _arm(self):
+        """Point the timer at the earliest pending deadline."""
+        heap = self._heap
+        while heap and not heap[0][2].active:
+            heapq.heappop(heap)
+        if not heap:
+            self._timer.stop()
+            return
+        delay_ms = max(0, int((heap[0][0] - time.monotonic()) * 1000))
+        self._timer.start(delay_ms)
+
+    def _run_due(self):
+        """Run every callback whose deadline has passed, then re-arm."""
+        heap = self._heap
+        # QTimer may fire up to a millisecond early; treat that as due
+        now = time.monotonic() + 0.001
+        while heap and heap[0][0] <= now:
+            _, _, call = heapq.heappop(heap)
+            if not call.active:
+                continue
+            call.active = False
+            try:
+                call.callback()
+            except Exception:
+                logger.exception("Scheduled callback failed")
+        self._arm()
+
+
+_scheduler = None
+
+
+def schedule(delay_ms, callback, *args):
+    """
+    Queue a callback on the process-wide scheduler.
+
+    The scheduler is created on first use, so a QApplication must exist.
+
+    Args:
+        delay_ms (int): Delay in milliseconds
+        callback (callable): Function to call; bound methods are held weakly
+        *args: Arguments to pass to the callback
+
+    Returns:
+        ScheduledCall: Handle that can cancel the call
+    """
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = Scheduler()
+    return _scheduler.schedule(delay_ms, callback, *args)
@@ -2,16 +2,24 @@
 Video loading and management functionality.
 """
 
+import logging
 import os
 import random
+from collections import deque
 
-from PyQt5.QtCore import QTimer, QUrl
+from PyQt5.QtCore import QUrl
 from PyQt5.QtMultimedia import QMediaContent
 
 from src.config.settings import (
     LOW_LATENCY_MODE,
     VIDEO_LOADING_TIMEOUT_MS,
 )
+from src.core.scheduler import schedule
+
+logger = logging.getLogger(__name__)
+
+# Position notify interval when nothing needs playback progress updates
+_IDLE_NOTIFY_INTERVAL_MS = 60000
 
 
 class VideoLoader:
@@ -28,11 +36,26 @@ class VideoLoader:
             local_videos (list, optional): List of local video file paths
         """
         self.m3u8_links = m3u8_links or []
-        self.local_videos = local_videos or []
-        self.recently_used_videos = []
+        self.set_local_videos(local_videos)
         self.failed_streams = set()
+        # Shuffled streams not yet handed out this round; refilled when drained
+        self._stream_pool = deque()
         self.player_count = 0  # Track number of players configured
 
+    def set_local_videos(self, local_videos):
+        """
+        Replace the local video pool and reset recently-used tracking.
+
+        Args:
+            local_videos (list): Local video file paths
+        """
+        # Already filtered by the folder scan; selection never re-validates files
+        self.local_videos = tuple(dict.fromkeys(local_videos or ()))
+        # Oldest entries fall off automatically once half the pool (max 20) is recent;
+        # the set mirrors the deque for O(1) membership tests
+        self.recently_used_videos = deque(maxlen=min(len(self.local_videos) // 2, 20))
+        self._recently_used_set = set()
+
     def load_stream(self, url, player, timeout_callback=None):
         """
         Load an M3U8 stream into a media player.
@@ -67,14 +90,13 @@ class VideoLoader:
                 # Store timeout timer on player for cleanup
                 if hasattr(player, "_loading_timer"):
                     player._loading_timer.stop()
-                player._loading_timer = QTimer()
-                player._loading_timer.setSingleShot(True)
-                player._loading_timer.timeout.connect(lambda: timeout_callback(url, player))
-                player._loading_timer.start(VIDEO_LOADING_TIMEOUT_MS)
+                player._loading_timer = schedule(
+                    VIDEO_LOADING_TIMEOUT_MS, timeout_callback, url, player
+                )
 
             return True
         except Exception as e:
-            print(f"Error loading stream {url}: {e}")
+            logger.warning("Error loading stream %s: %s", url, e)
             self.failed_streams.add(url)
             return False
 
@@ -91,19 +113,12 @@ class VideoLoader:
         if not self.local_videos:
             return None
 
-        # Get available videos that weren't recently used
-        available_videos = [v for v in self.local_videos if v not in self.recently_used_videos]
-
-        # If all videos have been recently used, reset and use all videos
-        if not available_videos:
-            self.recently_used_videos = []
-            available_videos = self.local_videos
-
-        if not available_videos:
-            return None
-
-        # Select a random video from available options
-        selected_video = random.choice(available_videos)
+        recent = self._recently_used_set
+        # Draw until we miss the recent set; at most half the pool is recent, so
+        # this averages under two draws without building an "available" list
+        selected_video = random.choice(self.local_videos)
+        while selected_video in recent:
+            selected_video = random.choice(self.local_videos)
 
         try:
             # Create QMediaContent with local file path
@@ -113,16 +128,30 @@ class VideoLoader:
             # Set media and playback options
             player.setMedia(media_content)
 
-            # Add to recently used and keep list at reasonable size
-            self.recently_used_videos.append(selected_video)
-            if len(self.recently_used_videos) > min(len(self.local_videos) // 2, 20):
-                self.recently_used_videos.pop(0)  # Remove oldest entry
+            # Add to recently used; the oldest entry drops off once the deque is full
+            self._mark_recently_used(selected_video)
 
             return selected_video
         except Exception as e:
-            print(f"Error loading local video {selected_video}: {e}")
+            logger.warning("Error loading local video %s: %s", selected_video, e)
             return None
 
+    def _mark_recently_used(self, video):
+        """
+        Record a video as recently used, keeping the deque and its set in sync.
+
+        Args:
+            video (str): Path of the video just loaded
+        """
+        recent = self.recently_used_videos
+        if recent.maxlen == 0:
+            return
+        if len(recent) == recent.maxlen:
+            # The deque's maxlen is about to evict the oldest entry
+            self._recently_used_set.discard(recent[0])
+        recent.append(video)
+        self._recently_used_set.add(video)
+
     def configure_player(self, player):
         """
         Configure a QMediaPlayer with optimal settings.
@@ -134,8 +163,9 @@ class VideoLoader:
         player.setMuted(True)
         player.setVolume(0)
 
-        # Set notification interval for smoother playback
-        player.setNotifyInterval(100)  # Update every 100ms instead of default
+        # Nothing consumes positionChanged, so keep notify ticks rare unless
+        # low-latency mode explicitly asks for them
+        player.setNotifyInterval(50 if LOW_LATENCY_MODE else _IDLE_NOTIFY_INTERVAL_MS)
 
         # Check if hardware acceleration is enabled
         hwa_enabled = os.environ.get("VIDEOWALL_HWA_ENABLED", "0") == "1"
@@ -143,13 +173,40 @@ class VideoLoader:
         # In PyQt5, we can't directly control HWA per player, but we can log the status
         if self.player_count == 0:
             if hwa_enabled:
-                print("Hardware acceleration: ENABLED for video playback")
+                logger.info("Hardware acceleration: ENABLED for video playback")
             else:
-                print("Hardware acceleration: DISABLED - using CPU only for video playback")
+                logger.info("Hardware acceleration: DISABLED - using CPU only for video playback")
 
         # Increment player count for next configuration
         self.player_count += 1
 
+    def _next_pooled_stream(self, exclude_set):
+        """
+        Pop the next usable stream from the shuffled pool.
+
+        The playlist is shuffled once per round rather than per call, so a
+        retry usually pops a single URL. Skipped URLs wait for the next round.
+
+        Args:
+            exclude_set (set): URLs the caller cannot use
+
+        Returns:
+            str: A non-failed, non-excluded stream URL, or None if none remain
+        """
+        pool = self._stream_pool
+        failed = self.failed_streams
+        # Entries left from the current round, then at most one fresh round
+        for refill in (False, True):
+            if refill:
+                shuffled = list(self.m3u8_links)
+                random.shuffle(shuffled)
+                pool.extend(shuffled)
+            while pool:
+                url = pool.popleft()
+                if url not in exclude_set and url not in failed:
+                    return url
+        return None
+
     def get_random_stream(self, exclude_list=None):
         """
         Get a random stream URL, avoiding those in the exclude list.
@@ -165,17 +222,16 @@ class VideoLoader:
 
         exclude_set = set(exclude_list or [])
 
+        # Prefer non-failed streams
+        url = self._next_pooled_stream(exclude_set)
+        if url:
+            return url
+
         # Filter available streams (excluding caller's blocklist)
         available_streams = [url for url in self.m3u8_links if url not in exclude_set]
-
         if not available_streams:
             return None
 
-        # Prefer non-failed streams
-        non_failed = [url for url in available_streams if url not in self.failed_streams]
-        if non_failed:
-            return random.choice(non_failed)
-
         # All remaining streams have failed before — clear failures and try one
         self.failed_streams.clear()
         return random.choice(available_streams)
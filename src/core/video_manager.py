@@ -2,14 +2,31 @@
 Video management for VideoWall.
 """
 
+import functools
+import logging
+import os
 import random
 
-from PyQt5.QtCore import QTimer
 from PyQt5.QtMultimedia import QMediaPlayer
 
-from src.config.settings import MAX_ACTIVE_PLAYERS
+from src.config.settings import MAX_ACTIVE_PLAYERS, STREAM_START_STAGGER_MS
+from src.core.scheduler import schedule, weak_callback
 from src.core.video_loader import VideoLoader
 
+logger = logging.getLogger(__name__)
+
+# Statuses after which a player has enough media to start playback
+_READY_STATUSES = frozenset((QMediaPlayer.LoadedMedia, QMediaPlayer.BufferedMedia))
+
+# Player error code -> tile status text
+_ERROR_MESSAGES = {
+    QMediaPlayer.ResourceError: "Resource Error",
+    QMediaPlayer.FormatError: "Format Error",
+    QMediaPlayer.NetworkError: "Network Error",
+    QMediaPlayer.AccessDeniedError: "Access Denied",
+    QMediaPlayer.ServiceMissingError: "Service Missing",
+}
+
 
 class VideoManager:
     """
@@ -28,10 +45,22 @@ class VideoManager:
         self.video_wall = video_wall
         self.tiles = video_wall.display_manager.tiles
         self.players = []
-        self.current_urls = {}
-        self.retry_attempts = {}
-        self.using_local_video = {}
-        self.tried_urls = {}
+        # Per-tile tracking, indexed by tile index; filled in by _initialize_players
+        self.current_urls = []
+        self.retry_attempts = []
+        self.using_local_video = []
+        self.tried_urls = []
+        self._pending_loads = []
+        # Set once the first refresh has handed content to the tiles
+        self._content_assigned = False
+
+        # Media status -> handler(status, player, tile_index); other statuses are ignored
+        self._status_handlers = {
+            QMediaPlayer.EndOfMedia: self._on_end_of_media,
+            QMediaPlayer.InvalidMedia: self._on_invalid_media,
+            QMediaPlayer.StalledMedia: self._on_media_stalled,
+        }
+        self._status_handlers.update(dict.fromkeys(_READY_STATUSES, self._on_media_ready))
 
         # Create the video loader
         self.video_loader = VideoLoader(m3u8_links, local_videos)
@@ -54,41 +83,54 @@ class VideoManager:
             player.setVideoOutput(tile)
 
             # Connect signals
-            player.error.connect(
-                lambda error, p=player, idx=i: self._handle_player_error(error, p, idx)
-            )
+            # partial binds only the index; the player is looked up on dispatch so
+            # the connection holds no reference to it
+            player.error.connect(functools.partial(self._handle_player_error, tile_index=i))
             player.mediaStatusChanged.connect(
-                lambda status, p=player, idx=i: self._handle_media_status_change(status, p, idx)
+                functools.partial(self._handle_media_status_change, tile_index=i)
             )
 
             # Add to player list
             self.players.append(player)
 
-            # Initialize tracking
-            self.retry_attempts[i] = 0
-            self.using_local_video[i] = False
-            self.tried_urls[i] = set()
+        # Initialize tracking
+        tile_count = len(self.tiles)
+        self.current_urls = [None] * tile_count
+        self.retry_attempts = [0] * tile_count
+        self.using_local_video = [False] * tile_count
+        self.tried_urls = [set() for _ in range(tile_count)]
+        # At most one deferred stream load (staggered start or retry) per tile;
+        # a newer request replaces the older
+        self._pending_loads = [None] * tile_count
 
     def assign_content_to_tiles(self):
         """
         Assign content (streams or local videos) to all tiles.
         Each visible tile gets a unique stream — no duplicates within a cycle.
         """
+        self._content_assigned = True
+
+        # Loads still deferred from the previous cycle are stale; every tile is reassigned
+        for i, pending in enumerate(self._pending_loads):
+            if pending:
+                pending.stop()
+                self._pending_loads[i] = None
+
         # Clear stale tried_urls each refresh cycle
-        for key in self.tried_urls:
-            self.tried_urls[key] = set()
+        for tried in self.tried_urls:
+            tried.clear()
 
         # Get only visible tile indices, shuffled for randomness
-        visible_indices = [i for i in range(len(self.tiles)) if self.tiles[i].isVisible()]
+        visible_indices = [i for i, tile in enumerate(self.tiles) if tile.isVisible()]
         random.shuffle(visible_indices)
 
-        # Build a shuffled pool of all available streams
-        available_streams = [
-            url
-            for url in self.video_loader.m3u8_links
-            if url not in self.video_loader.failed_streams
-        ]
-        random.shuffle(available_streams)
+        # Draw a random pool of non-failed streams, one per visible tile at most;
+        # sampling avoids shuffling the whole playlist when only a few are used
+        failed = self.video_loader.failed_streams
+        available_streams = [url for url in self.video_loader.m3u8_links if url not in failed]
+        available_streams = random.sample(
+            available_streams, min(len(visible_indices), len(available_streams))
+        )
 
         max_streams = min(len(visible_indices), MAX_ACTIVE_PLAYERS, len(available_streams))
 
@@ -106,21 +148,42 @@ class VideoManager:
             stream_url = available_streams[stream_pool_idx]
             stream_pool_idx += 1
 
-            tile = self.tiles[idx]
-            player = self.players[idx]
+            # Stagger starts so the HLS connects and manifest fetches don't all land at once
+            delay_ms = assigned_count * STREAM_START_STAGGER_MS
+            assigned_count += 1
+            self.tiles[idx].show_loading("Loading stream...")
+            if delay_ms:
+                # The previous load's timeout would otherwise fire during the wait
+                # and schedule a retry over this start
+                player = self.players[idx]
+                if hasattr(player, "_loading_timer"):
+                    player._loading_timer.stop()
+                    delattr(player, "_loading_timer")
+                self._pending_loads[idx] = schedule(delay_ms, self._start_stream, idx, stream_url)
+            else:
+                self._start_stream(idx, stream_url)
+
+    def _start_stream(self, tile_index, stream_url):
+        """
+        Load and play a stream on a tile, falling back to a local video on failure.
 
-            def _stream_timeout(url, p, i=idx):
-                self._handle_stream_timeout(url, p, i)
+        Args:
+            tile_index (int): Index of the tile
+            stream_url (str): Stream URL to load
+        """
+        # Players are released when the window closes
+        if not self.players:
+            return
+        self._pending_loads[tile_index] = None
 
-            timeout_callback = _stream_timeout
-            if self.video_loader.load_stream(stream_url, player, timeout_callback):
-                player.play()
-                self.current_urls[idx] = stream_url
-                self.using_local_video[idx] = False
-                assigned_count += 1
-                tile.show_loading("Loading stream...")
-            else:
-                self._fallback_to_local_video(idx)
+        player = self.players[tile_index]
+        timeout_callback = weak_callback(self._handle_stream_timeout, tile_index=tile_index)
+        if self.video_loader.load_stream(stream_url, player, timeout_callback):
+            player.play()
+            self.current_urls[tile_index] = stream_url
+            self.using_local_video[tile_index] = False
+        else:
+            self._fallback_to_local_video(tile_index)
 
     def _fallback_to_local_video(self, tile_index):
         """
@@ -153,13 +216,35 @@ class VideoManager:
             # player.play() will be called in _handle_media_status_change
 
             # Show brief status (will be hidden when media loads)
-            video_name = video_path.split("/")[-1]
+            video_name = os.path.basename(video_path)
             tile.show_status(f"Local: {video_name}", duration_ms=3000)
         else:
             # Failed to load local video
             tile.hide_loading()
             tile.show_status("Failed to load video", is_error=True)
 
+    def set_local_videos(self, local_videos):
+        """
+        Replace the local video pool and back-fill visible tiles left without media.
+
+        Args:
+            local_videos (list): Local video file paths
+        """
+        self.video_loader.set_local_videos(local_videos)
+
+        # Before the first refresh there is nothing to back-fill; it will use the new pool
+        if not self._content_assigned or not self.video_loader.local_videos:
+            return
+
+        stopped = QMediaPlayer.StoppedState
+        pending = self._pending_loads
+        for i, (tile, player) in enumerate(zip(self.tiles, self.players)):
+            # A deferred stream load would overwrite the local video it gets here
+            if pending[i] is not None:
+                continue
+            if tile.isVisible() and not self.using_local_video[i] and player.state() == stopped:
+                self._fallback_to_local_video(i)
+
     def pause_all_players(self):
         """Pause all media players."""
         for player in self.players:
@@ -168,9 +253,16 @@ class VideoManager:
 
     def resume_visible_players(self):
         """Resume playback on all visible tile media players."""
-        for i, tile in enumerate(self.tiles):
-            if tile.isVisible() and self.players[i].state() != QMediaPlayer.PlayingState:
-                self.players[i].play()
+        pending = self._pending_loads
+        # zip stops short once closeEvent has released the players
+        for i, (tile, player) in enumerate(zip(self.tiles, self.players)):
+            # A tile waiting on a deferred load would otherwise resume its old media
+            if (
+                pending[i] is None
+                and tile.isVisible()
+                and player.state() != QMediaPlayer.PlayingState
+            ):
+                player.play()
 
     def _handle_stream_timeout(self, url, player, tile_index):
         """
@@ -181,7 +273,7 @@ class VideoManager:
             player (QMediaPlayer): The player that timed out
             tile_index (int): Index of the tile
         """
-        print(f"Stream loading timeout for tile {tile_index}: {url[:60]}...")
+        logger.info("Stream loading timeout for tile %d: %.60s...", tile_index, url)
 
         # Clean up the timer
         if hasattr(player, "_loading_timer"):
@@ -190,7 +282,7 @@ class VideoManager:
 
         # Mark URL as failed
         self.video_loader.failed_streams.add(url)
-        self.tried_urls.setdefault(tile_index, set()).add(url)
+        self.tried_urls[tile_index].add(url)
 
         # Show timeout message briefly
         self.tiles[tile_index].hide_loading()
@@ -204,7 +296,33 @@ class VideoManager:
             self._fallback_to_local_video(tile_index)
         else:
             # Try another stream
-            QTimer.singleShot(500, lambda: self.retry_tile_stream(tile_index))
+            self._schedule_retry(tile_index, 500)
+
+    def _schedule_retry(self, tile_index, delay_ms):
+        """
+        Defer a stream retry for a tile, replacing any retry already pending for it.
+
+        Args:
+            tile_index (int): Index of the tile to retry
+            delay_ms (int): Delay before retrying in milliseconds
+        """
+        pending = self._pending_loads[tile_index]
+        if pending:
+            pending.stop()
+        self._pending_loads[tile_index] = schedule(delay_ms, self.retry_tile_stream, tile_index)
+
+    def retry_tile_streams(self, tile_indices):
+        """
+        Retry several tiles, staggering the reloads like a content refresh.
+
+        Args:
+            tile_indices (list): Indices of the tiles to retry
+        """
+        for order, tile_index in enumerate(tile_indices):
+            if order:
+                self._schedule_retry(tile_index, order * STREAM_START_STAGGER_MS)
+            else:
+                self.retry_tile_stream(tile_index)
 
     def retry_tile_stream(self, tile_index):
         """
@@ -213,6 +331,16 @@ class VideoManager:
         Args:
             tile_index (int): Index of the tile to retry
         """
+        # Players are released when the window closes; nothing left to retry
+        if not self.players:
+            return
+
+        # Retrying now supersedes any retry still waiting for this tile
+        pending = self._pending_loads[tile_index]
+        if pending:
+            pending.stop()
+            self._pending_loads[tile_index] = None
+
         # Check if we should retry
         if self.retry_attempts[tile_index] >= 3:
             # Too many retries, switch to local video
@@ -221,9 +349,10 @@ class VideoManager:
             return
 
         # Get a new stream URL that hasn't been tried
-        exclude_list = self.tried_urls.get(tile_index, set())
-        if self.current_urls.get(tile_index):
-            exclude_list.add(self.current_urls[tile_index])
+        exclude_list = self.tried_urls[tile_index]
+        current_url = self.current_urls[tile_index]
+        if current_url:
+            exclude_list.add(current_url)
 
         stream_url = self.video_loader.get_random_stream(exclude_list)
         if not stream_url:
@@ -235,10 +364,7 @@ class VideoManager:
         player = self.players[tile_index]
         tile = self.tiles[tile_index]
 
-        def _retry_timeout(url, p):
-            self._handle_stream_timeout(url, p, tile_index)
-
-        timeout_callback = _retry_timeout
+        timeout_callback = weak_callback(self._handle_stream_timeout, tile_index=tile_index)
         if self.video_loader.load_stream(stream_url, player, timeout_callback):
             player.play()
             self.current_urls[tile_index] = stream_url
@@ -247,88 +373,76 @@ class VideoManager:
             self.retry_attempts[tile_index] += 1
         else:
             # Stream loading failed
-            self.tried_urls.setdefault(tile_index, set()).add(stream_url)
+            self.tried_urls[tile_index].add(stream_url)
             self.retry_attempts[tile_index] += 1
-            # Use QTimer to avoid synchronous recursion that could overflow the call stack
-            QTimer.singleShot(200, lambda: self.retry_tile_stream(tile_index))
+            # Defer to avoid synchronous recursion that could overflow the call stack
+            self._schedule_retry(tile_index, 200)
 
-    def _handle_player_error(self, error, player, tile_index):
+    def _handle_player_error(self, error, tile_index):
         """
         Handle media player errors.
 
         Args:
             error: The error code
-            player (QMediaPlayer): The player that encountered the error
-            tile_index (int): Index of the tile
+            tile_index (int): Index of the tile whose player encountered the error
         """
         if error != QMediaPlayer.NoError:
-            error_messages = {
-                QMediaPlayer.ResourceError: "Resource Error",
-                QMediaPlayer.FormatError: "Format Error",
-                QMediaPlayer.NetworkError: "Network Error",
-                QMediaPlayer.AccessDeniedError: "Access Denied",
-                QMediaPlayer.ServiceMissingError: "Service Missing",
-            }
-            error_text = error_messages.get(error, f"Unknown Error {error}")
-            error_message = f"Player error on tile {tile_index}: {error_text}"
-            print(error_message)
+            error_text = _ERROR_MESSAGES.get(error) or f"Unknown Error {error}"
+            logger.warning("Player error on tile %d: %s", tile_index, error_text)
 
             # Remember failed URL
-            current_url = self.current_urls.get(tile_index)
+            current_url = self.current_urls[tile_index]
             if current_url:
-                self.tried_urls.setdefault(tile_index, set()).add(current_url)
-                print(f"  Failed URL: {current_url[:60]}...")
+                self.tried_urls[tile_index].add(current_url)
+                logger.debug("  Failed URL: %.60s...", current_url)
 
             # Show error briefly
             self.tiles[tile_index].show_status(error_text, is_error=True, duration_ms=2000)
 
             # Schedule retry or fallback
-            QTimer.singleShot(500, lambda: self.retry_tile_stream(tile_index))
+            self._schedule_retry(tile_index, 500)
 
-    def _handle_media_status_change(self, status, player, tile_index):
+    def _handle_media_status_change(self, status, tile_index):
         """
         Handle changes in media status.
 
         Args:
             status: The media status
-            player (QMediaPlayer): The player whose status changed
-            tile_index (int): Index of the tile
+            tile_index (int): Index of the tile whose player changed status
         """
         # Media status codes:
         # 0 = UnknownMediaStatus, 1 = NoMedia, 2 = LoadingMedia
         # 3 = LoadedMedia, 4 = StalledMedia, 5 = BufferingMedia
         # 6 = BufferedMedia, 7 = EndOfMedia, 8 = InvalidMedia
+        handler = self._status_handlers.get(status)
+        if handler:
+            handler(status, self.players[tile_index], tile_index)
 
-        if status == QMediaPlayer.EndOfMedia:
-            # Media has ended, restart it for looping
-            player.setPosition(0)
-            player.play()
-
-        elif status == QMediaPlayer.LoadedMedia:
-            # Media loaded successfully, cancel timeout and hide loading
-            if hasattr(player, "_loading_timer"):
-                player._loading_timer.stop()
-                delattr(player, "_loading_timer")
-            self.tiles[tile_index].hide_loading()
-            if player.state() == QMediaPlayer.StoppedState:
-                player.play()
-            print(f"Stream loaded on tile {tile_index}")
-
-        elif status == QMediaPlayer.BufferedMedia:
-            # Media is buffered and ready to play, cancel timeout and hide loading
-            if hasattr(player, "_loading_timer"):
-                player._loading_timer.stop()
-                delattr(player, "_loading_timer")
-            self.tiles[tile_index].hide_loading()
-            if player.state() == QMediaPlayer.StoppedState:
-                player.play()
-            print(f"Stream buffered and playing on tile {tile_index}")
-
-        elif status == QMediaPlayer.InvalidMedia:
-            print(f"Invalid media on tile {tile_index} - retrying")
-            self.retry_tile_stream(tile_index)
+    def _on_end_of_media(self, status, player, tile_index):
+        """Media has ended, restart it for looping."""
+        player.setPosition(0)
+        player.play()
 
-        elif status == QMediaPlayer.StalledMedia:
-            # Media has stalled, try to restart
-            if player.state() != QMediaPlayer.PlayingState:
-                player.play()
+    def _on_media_ready(self, status, player, tile_index):
+        """Media loaded or buffered and ready to play, cancel timeout and hide loading."""
+        if hasattr(player, "_loading_timer"):
+            player._loading_timer.stop()
+            delattr(player, "_loading_timer")
+        self.tiles[tile_index].hide_loading()
+        if player.state() == QMediaPlayer.StoppedState:
+            player.play()
+        logger.debug(
+            "Stream %s on tile %d",
+            "loaded" if status == QMediaPlayer.LoadedMedia else "buffered and playing",
+            tile_index,
+        )
+
+    def _on_invalid_media(self, status, player, tile_index):
+        """Media could not be played, try another stream."""
+        logger.info("Invalid media on tile %d - retrying", tile_index)
+        self.retry_tile_stream(tile_index)
+
+    def _on_media_stalled(self, status, player, tile_index):
+        """Media has stalled, try to restart."""
+        if player.state() != QMediaPlayer.PlayingState:
+            player.play()
@@ -2,16 +2,22 @@
 Main VideoWall implementation.
 """
 
-from PyQt5.QtCore import Qt, QTimer
+import logging
+
+from PyQt5.QtCore import Qt, QThreadPool, QTimer
 from PyQt5.QtMultimedia import QMediaPlayer
 from PyQt5.QtWidgets import QMainWindow
 
 from src.config.settings import STREAM_CHECK_INTERVAL_MS
 from src.core.display_manager import DisplayManager
+from src.core.folder_scanner import FolderScanWorker
 from src.core.layout_manager import LayoutManager
 from src.core.recorder import ScreenRecorder
+from src.core.scheduler import schedule
 from src.core.video_manager import VideoManager
 
+logger = logging.getLogger(__name__)
+
 
 class VideoWall(QMainWindow):
     """
@@ -19,7 +25,16 @@ class VideoWall(QMainWindow):
     video tiles across one or more monitors.
     """
 
-    def __init__(self, app, m3u8_links=None, local_videos=None, screen=None, parent=None):
+    def __init__(
+        self,
+        app,
+        m3u8_links=None,
+        local_videos=None,
+        screen=None,
+        local_folder=None,
+        walls=None,
+        parent=None,
+    ):
         """
         Initialize the VideoWall with configuration.
 
@@ -28,6 +43,9 @@ class VideoWall(QMainWindow):
             m3u8_links (list, optional): List of M3U8 stream URLs
             local_videos (list, optional): List of local video file paths
             screen (QScreen, optional): Screen to display the video wall on
+            local_folder (str, optional): Folder the local videos were scanned from
+            walls (list, optional): Every VideoWall in the app, this one included;
+                a Ctrl+R rescan updates all of them
             parent (QWidget, optional): Parent widget
         """
         super().__init__(parent)
@@ -35,7 +53,13 @@ class VideoWall(QMainWindow):
         self.screen = screen
         self.m3u8_links = m3u8_links or []
         self.local_videos = local_videos or []
+        self.local_folder = local_folder
+        self.walls = walls if walls is not None else [self]
+        # Ctrl+R rescan in flight, kept referenced until it reports back
+        self._rescan_worker = None
         self.is_fullscreen = True
+        # Set by closeEvent; deferred callbacks that outlive the window check it
+        self._closed = False
         self.windowed_geometry = None
 
         # Window setup
@@ -72,7 +96,7 @@ class VideoWall(QMainWindow):
         self._setup_refresh_timer()
 
         # Initial content assignment (delayed to prevent blocking)
-        QTimer.singleShot(1000, self.refresh_all_videos)  # Start videos after 1 second
+        schedule(1000, self.refresh_all_videos)  # Start videos after 1 second
 
     def _setup_keyboard_shortcuts(self):
         """Set up keyboard shortcuts for the application."""
@@ -84,11 +108,66 @@ class VideoWall(QMainWindow):
     def _setup_refresh_timer(self):
         """Set up periodic refresh timer for stream health checks."""
         self.stream_check_timer = QTimer(self)
+        # A 30 s health check does not need sub-second accuracy
+        self.stream_check_timer.setTimerType(Qt.VeryCoarseTimer)
         self.stream_check_timer.timeout.connect(self.check_stream_health)
         self.stream_check_timer.start(STREAM_CHECK_INTERVAL_MS)
 
+    def set_local_videos(self, local_videos):
+        """
+        Hand local videos found by a background folder scan to this wall.
+
+        Args:
+            local_videos (list): Local video file paths
+        """
+        if self._closed:
+            return
+        self.local_videos = local_videos
+        self.video_manager.set_local_videos(local_videos)
+
+    def refresh_metadata(self):
+        """Rescan the local video folder, ignoring the on-disk scan cache."""
+        if not self.local_folder:
+            logger.info("No local video folder configured; nothing to rescan")
+            return
+        # The scan cache is process-wide, so one rescan serves every wall
+        if any(wall._rescan_worker is not None for wall in self.walls):
+            return
+
+        logger.info("Rescanning local videos in %s", self.local_folder)
+        self.start_folder_scan(refresh=True)
+
+    def start_folder_scan(self, refresh=False):
+        """
+        Scan the local video folder in the background and deliver it to every wall.
+
+        The worker is tracked as this wall's in-flight scan, so a Ctrl+R pressed
+        while it runs is ignored instead of starting a second scan.
+
+        Args:
+            refresh (bool, optional): Ignore cached listings and re-read every directory
+        """
+        worker = FolderScanWorker(self.local_folder, refresh=refresh)
+        worker.signals.finished.connect(self._on_rescan_finished)
+        for wall in self.walls:
+            worker.signals.finished.connect(wall.set_local_videos)
+        self._rescan_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_rescan_finished(self, local_videos):
+        """
+        Clear the in-flight marker once a folder scan reports back.
+
+        Args:
+            local_videos (list): Local video file paths (applied via set_local_videos)
+        """
+        self._rescan_worker = None
+
     def refresh_all_videos(self):
         """Refresh all videos with new content and layout."""
+        if self._closed:
+            return
+
         # Stop animations
         if self.animator:
             self.animator.stop_timers_and_animations()
@@ -98,13 +177,13 @@ class VideoWall(QMainWindow):
 
         # Apply a new random layout
         layout_pattern = self.layout_manager.apply_random_layout()
-        print(f"Applied {layout_pattern} layout pattern")
+        logger.debug("Applied %s layout pattern", layout_pattern)
 
         # Assign videos to tiles
         self.video_manager.assign_content_to_tiles()
 
         # Resume playback after a delay for smooth transition
-        QTimer.singleShot(500, self.video_manager.resume_visible_players)
+        schedule(500, self.video_manager.resume_visible_players)
 
         # Restart animator
         if self.animator:
@@ -112,17 +191,23 @@ class VideoWall(QMainWindow):
 
     def check_stream_health(self):
         """Check the health of all streams and retry if needed."""
-        for i, player in enumerate(self.video_manager.players):
+        video_manager = self.video_manager
+        using_local = video_manager.using_local_video
+        tiles = self.display_manager.tiles
+        unhealthy = []
+        for i, player in enumerate(video_manager.players):
             # Check only visible stream tiles (not local videos)
-            if self.display_manager.tiles[
-                i
-            ].isVisible() and not self.video_manager.using_local_video.get(i, True):
+            if using_local[i] or not tiles[i].isVisible():
+                continue
 
-                # Check if player is in a good state
-                if player.state() != QMediaPlayer.PlayingState:
-                    # Try to recover the stream
-                    print(f"Stream health check: Tile {i} needs recovery")
-                    self.video_manager.retry_tile_stream(i)
+            # Check if player is in a good state
+            if player.state() != QMediaPlayer.PlayingState:
+                logger.info("Stream health check: Tile %d needs recovery", i)
+                unhealthy.append(i)
+
+        # Try to recover the streams without reconnecting them all at once
+        if unhealthy:
+            video_manager.retry_tile_streams(unhealthy)
 
     def keyPressEvent(self, event):
         """
@@ -147,16 +232,17 @@ class VideoWall(QMainWindow):
         elif key == Qt.Key_Right:
             # Right arrow key triggers manual refresh
             if not self.right_key_timer.isActive():
-                print("Manual refresh triggered")
+                logger.info("Manual refresh triggered")
                 self.right_key_timer.start(500)  # Debounce for 500ms
 
+        elif event.modifiers() == Qt.ControlModifier and key == Qt.Key_R:
+            # Ctrl+R rescans the local video folder
+            self.refresh_metadata()
+
         elif key == Qt.Key_R:
             # R key toggles screen recording
             state = self.recorder.toggle()
-            if state:
-                print("Recording: ON")
-            else:
-                print("Recording: OFF")
+            logger.info("Recording: %s", "ON" if state else "OFF")
 
         elif event.modifiers() == Qt.ControlModifier and key == Qt.Key_Q:
             # Ctrl+Q quits the application
@@ -166,6 +252,18 @@ class VideoWall(QMainWindow):
             # Pass other key events to parent class
             super().keyPressEvent(event)
 
+    def resizeEvent(self, event):
+        """
+        Handle window resize events.
+
+        Args:
+            event (QResizeEvent): Resize event
+        """
+        super().resizeEvent(event)
+        animator = getattr(self, "animator", None)
+        if animator:
+            animator.invalidate_geometry_cache()
+
     def closeEvent(self, event):
         """
         Handle window close event.
@@ -173,6 +271,8 @@ class VideoWall(QMainWindow):
         Args:
             event (QCloseEvent): Close event
         """
+        self._closed = True
+
         # Stop all timers
         if hasattr(self, "stream_check_timer"):
             self.stream_check_timer.stop()
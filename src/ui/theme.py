@@ -478,16 +478,6 @@ def get_video_tile_stylesheet():
     """
 
 
-def get_video_tile_fade_stylesheet():
-    """Stylesheet for tile animation fade effect."""
-    return """
-        QVideoWidget {
-            background-color: rgba(10, 11, 14, 200);
-            border: none;
-        }
-    """
-
-
 def get_status_label_stylesheet(is_error=False):
     """
     Stylesheet for status overlay labels on video tiles.
@@ -3,6 +3,8 @@ Video tile widget implementation.
 Dark Neo Glass themed.
 """
 
+import logging
+
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtMultimediaWidgets import QVideoWidget
 from PyQt5.QtWidgets import QLabel, QProgressBar, QSizePolicy
@@ -13,6 +15,8 @@ from src.ui.theme import (
     get_video_tile_stylesheet,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class VideoTile(QVideoWidget):
     """
@@ -41,6 +45,14 @@ class VideoTile(QVideoWidget):
         self.status_label.setWordWrap(True)
         self.status_label.adjustSize()
         self.status_label.show()
+        # Reused for every auto-hide; restarting it also drops an older pending hide
+        self._status_hide_timer = QTimer(self)
+        self._status_hide_timer.setSingleShot(True)
+        self._status_hide_timer.timeout.connect(self.safe_hide_status)
+        # (text, text_width, label_height) measured for the current label text/style
+        self._label_metrics_cache = None
+        # (text, tile_width, tile_height) the label was last positioned for
+        self._label_position_key = None
 
         # Add loading progress bar
         self.loading_progress = QProgressBar(self)
@@ -71,9 +83,20 @@ class VideoTile(QVideoWidget):
             return
 
         try:
-            text_width = self.status_label.fontMetrics().horizontalAdvance(self.status_label.text())
+            text = self.status_label.text()
+            position_key = (text, self.width(), self.height())
+            if position_key == self._label_position_key:
+                return
+
+            cache = self._label_metrics_cache
+            if cache and cache[0] == text:
+                text_width, label_height = cache[1], cache[2]
+            else:
+                text_width = self.status_label.fontMetrics().horizontalAdvance(text)
+                label_height = self.status_label.sizeHint().height()
+                self._label_metrics_cache = (text, text_width, label_height)
+
             label_width = min(self.width() * 0.9, text_width + 20)
-            label_height = self.status_label.sizeHint().height()
 
             x = (self.width() - label_width) / 2
             y = (self.height() - label_height) / 2
@@ -84,8 +107,14 @@ class VideoTile(QVideoWidget):
             label_height = min(label_height, self.height())
 
             self.status_label.setGeometry(int(x), int(y), int(label_width), int(label_height))
+            self._label_position_key = position_key
         except Exception as e:
-            print(f"Error in VideoTile reposition_status_label for {self.tile_id}: {e}")
+            logger.warning("Error in VideoTile reposition_status_label for %s: %s", self.tile_id, e)
+
+    def _invalidate_label_metrics(self):
+        """Forget measured label metrics after its text or stylesheet changes."""
+        self._label_metrics_cache = None
+        self._label_position_key = None
 
     def reposition_loading_progress(self):
         """Calculates and sets the geometry for the loading progress bar."""
@@ -108,7 +137,9 @@ class VideoTile(QVideoWidget):
                 int(x), int(y), int(progress_width), int(progress_height)
             )
         except Exception as e:
-            print(f"Error in VideoTile reposition_loading_progress for {self.tile_id}: {e}")
+            logger.warning(
+                "Error in VideoTile reposition_loading_progress for %s: %s", self.tile_id, e
+            )
 
     def _update_loading_animation(self):
         """Updates the loading progress bar animation."""
@@ -117,7 +148,9 @@ class VideoTile(QVideoWidget):
             new_value = (current_value + 5) % 100
             self.loading_progress.setValue(new_value)
         except Exception as e:
-            print(f"Error in VideoTile _update_loading_animation for {self.tile_id}: {e}")
+            logger.warning(
+                "Error in VideoTile _update_loading_animation for %s: %s", self.tile_id, e
+            )
 
     def show_loading(self, message="Loading..."):
         """
@@ -129,6 +162,7 @@ class VideoTile(QVideoWidget):
         try:
             self.status_label.setText(message)
             self.status_label.setStyleSheet(get_status_label_stylesheet(is_error=False))
+            self._invalidate_label_metrics()
             self.status_label.show()
             self.reposition_status_label()
 
@@ -140,7 +174,7 @@ class VideoTile(QVideoWidget):
             if not self.loading_timer.isActive():
                 self.loading_timer.start(100)  # Update every 100ms
         except Exception as e:
-            print(f"Error in show_loading for Tile {self.tile_id}: {e}")
+            logger.warning("Error in show_loading for Tile %s: %s", self.tile_id, e)
 
     def hide_loading(self):
         """Hides the loading animation."""
@@ -149,7 +183,7 @@ class VideoTile(QVideoWidget):
             self.loading_progress.hide()
             self.safe_hide_status()
         except Exception as e:
-            print(f"Error in hide_loading for Tile {self.tile_id}: {e}")
+            logger.warning("Error in hide_loading for Tile %s: %s", self.tile_id, e)
 
     def show_status(self, text, is_error=False, duration_ms=3000):
         """
@@ -163,13 +197,16 @@ class VideoTile(QVideoWidget):
         try:
             self.status_label.setText(text)
             self.status_label.setStyleSheet(get_status_label_stylesheet(is_error=is_error))
+            self._invalidate_label_metrics()
             self.status_label.show()
             self.reposition_status_label()
 
             if duration_ms > 0:
-                QTimer.singleShot(duration_ms, self.safe_hide_status)
+                self._status_hide_timer.start(duration_ms)
+            else:
+                self._status_hide_timer.stop()
         except Exception as e:
-            print(f"Error in show_status for Tile {self.tile_id}: {e}")
+            logger.warning("Error in show_status for Tile %s: %s", self.tile_id, e)
 
     def safe_hide_status(self):
         """Safely hides the status label, checking if the widget still exists."""
@@ -179,4 +216,4 @@ class VideoTile(QVideoWidget):
         except RuntimeError:
             pass
         except Exception as e:
-            print(f"Error hiding status label safely for Tile {self.tile_id}: {e}")
+            logger.warning("Error hiding status label safely for Tile %s: %s", self.tile_id, e)
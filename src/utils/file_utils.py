@@ -2,7 +2,34 @@
 File handling utilities for VideoWall.
 """
 
+import logging
 import os
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from src.config.settings import SCAN_MAX_WORKERS
+from src.utils.scan_cache import ScanCache
+
+logger = logging.getLogger(__name__)
+
+# Scheme, a dot somewhere after it, and no embedded whitespace; the dot may sit in
+# the path so dotless LAN hostnames such as http://nas/live.m3u8 still pass
+_URL_RE = re.compile(r"^https?://[^\s]+\.[^\s]+$")
+
+# Lowercase video extensions; str.endswith accepts the tuple in one call
+_VIDEO_EXTS = (
+    ".mp4",
+    ".mkv",
+    ".avi",
+    ".mov",
+    ".wmv",
+    ".flv",
+    ".webm",
+    ".m4v",
+    ".mpg",
+    ".mpeg",
+    ".3gp",
+)
 
 
 def get_all_m3u8_links(file_path):
@@ -19,83 +46,189 @@ def get_all_m3u8_links(file_path):
         FileNotFoundError: If the file doesn't exist
     """
     try:
+        # dict preserves insertion order, so this dedupes without a sort round-trip
+        seen = {}
+        total = 0
+        # Iterate the handle directly so only one line is held in memory at a time
         with open(file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        links = []
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith("#"):
-                # Ensure URL has http/https protocol
-                if not line.startswith(("http://", "https://")):
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                total += 1
+
+                # Ensure URL has http/https protocol; the first-character test
+                # rejects scheme-less lines without the tuple startswith
+                if line[0] != "h" or not line.startswith(("http://", "https://")):
                     line = "https://" + line
-                links.append(line)
 
-        unique_links = sorted(list(set(links)))
-        print(f"Loaded {len(links)} links, {len(unique_links)} unique.")
+                if _URL_RE.match(line):
+                    seen[line] = None
+                else:
+                    logger.debug("Skipping invalid URL: %s", line)
 
-        # Validate URLs
-        valid_links = []
-        for url in unique_links:
-            if "://" in url and "." in url:  # Very basic URL validation
-                valid_links.append(url)
-            else:
-                print(f"Warning: Skipping invalid URL: {url}")
+        valid_links = list(seen)
+        logger.info("Loaded %d links, %d unique.", total, len(valid_links))
 
         if not valid_links:
-            print("Warning: No valid M3U8 links found in the file.")
+            logger.warning("No valid M3U8 links found in the file.")
 
         return valid_links
     except FileNotFoundError:
-        print(f"Error: File not found at {file_path}")
+        logger.error("File not found at %s", file_path)
         return []
     except Exception as e:
-        print(f"Error reading file '{file_path}': {e}")
+        logger.error("Error reading file '%s': %s", file_path, e)
         return []
 
 
-def get_video_files_recursively(folder_path):
+def _scan_dir(path, extensions):
     """
-    Recursively scan a folder for video files.
+    Scan a single directory level for video files and subdirectories.
+
+    DirEntry caches the file type and stat result, so each regular file costs
+    one stat() call instead of the three made by os.walk + exists + getsize.
+    Symlinked files are followed, as os.walk did; symlinked directories are not.
 
     Args:
-        folder_path (str): Path to the folder to scan
+        path (str): Directory to scan
+        extensions (tuple): Lowercase file extensions to accept
 
     Returns:
-        list: List of full paths to video files
+        tuple: (list of non-empty video file paths, list of subdirectory paths,
+            cacheable) where cacheable is False if the directory could not be read
+            or held empty candidates, which may still be growing without changing
+            the directory's mtime
     """
-    video_extensions = [
-        ".mp4",
-        ".mkv",
-        ".avi",
-        ".mov",
-        ".wmv",
-        ".flv",
-        ".webm",
-        ".m4v",
-        ".mpg",
-        ".mpeg",
-        ".3gp",
-    ]
-    video_files = []
-
+    files = []
+    subdirs = []
+    cacheable = True
     try:
-        for root, dirs, files in os.walk(folder_path, followlinks=False):
-            for file in files:
+        with os.scandir(path) as it:
+            for entry in it:
                 # Skip hidden files (starting with ._) and other metadata files
-                if file.startswith("._") or file.startswith("."):
+                if entry.name.startswith("."):
+                    continue
+
+                try:
+                    # Directory symlinks are not followed, which rules out scan loops
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    # File symlinks are followed; a broken link raises OSError below
+                    elif entry.is_file():
+                        if not entry.name.lower().endswith(extensions):
+                            continue
+                        # Verify file is accessible and non-empty
+                        if entry.stat().st_size > 0:
+                            files.append(entry.path)
+                        else:
+                            cacheable = False
+                except OSError:
                     continue
+    except PermissionError:
+        logger.warning("Permission denied scanning %s", path)
+        return [], [], False
+    except OSError as e:
+        logger.warning("Could not scan %s: %s", path, e)
+        return [], [], False
+    return files, subdirs, cacheable
+
+
+def _scan_video_files(path, extensions, scan_dir=_scan_dir):
+    """
+    Recursively yield video file paths under a directory, one level at a time.
+
+    Args:
+        path (str): Directory to scan
+        extensions (tuple): Lowercase file extensions to accept
+        scan_dir (callable, optional): Per-directory scan function
+
+    Yields:
+        str: Full path to each non-empty video file
+    """
+    files, subdirs, _ = scan_dir(path, extensions)
+    yield from files
+    for subdir in subdirs:
+        yield from _scan_video_files(subdir, extensions, scan_dir)
+
+
+def _scan_video_files_parallel(path, extensions, scan_dir=_scan_dir, max_workers=SCAN_MAX_WORKERS):
+    """
+    Recursively scan a directory tree, fanning subdirectories out to a thread pool.
+
+    Directory reads release the GIL, so threads overlap disk and network
+    latency when a library spans several drives or a network mount.
+
+    Args:
+        path (str): Root directory to scan
+        extensions (tuple): Lowercase file extensions to accept
+        scan_dir (callable, optional): Per-directory scan function
+        max_workers (int, optional): Number of scanner threads
+
+    Returns:
+        list: Full paths to non-empty video files
+    """
+    video_files = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(scan_dir, path, extensions)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs, _ = future.result()
+                video_files.extend(files)
+                pending.update(executor.submit(scan_dir, d, extensions) for d in subdirs)
+    return video_files
+
+
+def _scan_video_folder(folder_path, refresh):
+    """
+    Scan a folder for video files through the on-disk scan cache.
+
+    Args:
+        folder_path (str): Absolute path to the folder to scan
+        refresh (bool): Ignore the on-disk scan cache and re-read every directory
+
+    Returns:
+        list: Full paths to video files
+    """
+    cache = ScanCache(folder_path)
+    if refresh:
+        cache.clear()
+    scan_dir = cache.wrap(_scan_dir)
+
+    try:
+        video_files = _scan_video_files_parallel(cache.root, _VIDEO_EXTS, scan_dir)
+    except (OSError, RuntimeError) as e:
+        logger.warning("Parallel scan failed (%s), falling back to serial scan", e)
+        video_files = list(_scan_video_files(cache.root, _VIDEO_EXTS, scan_dir))
+
+    cache.save()
+    return video_files
 
-                if any(file.lower().endswith(ext) for ext in video_extensions):
-                    full_path = os.path.join(root, file)
-                    # Verify file exists and is accessible
-                    if os.path.exists(full_path) and os.path.getsize(full_path) > 0:
-                        video_files.append(full_path)
 
-        print(
-            f"Found {len(video_files)} valid local video files in {folder_path} and subdirectories."
+def get_video_files_recursively(folder_path, refresh=False):
+    """
+    Recursively scan a folder for video files.
+
+    Directory listings are cached on disk between runs; directories whose
+    mtime is unchanged are not re-read.
+
+    Args:
+        folder_path (str): Path to the folder to scan
+        refresh (bool, optional): Ignore the scan cache and re-read every directory
+
+    Returns:
+        list: List of full paths to video files
+    """
+    try:
+        video_files = _scan_video_folder(os.path.abspath(folder_path), refresh)
+
+        logger.info(
+            "Found %d valid local video files in %s and subdirectories.",
+            len(video_files),
+            folder_path,
         )
         return video_files
     except Exception as e:
-        print(f"Error scanning for video files: {e}")
+        logger.error("Error scanning for video files: %s", e)
         return []
@@ -0,0 +1,32 @@
+"""
+Qt layout helpers for VideoWall.
+"""
+
+from contextlib import contextmanager
+
+
+@contextmanager
+def batched_layout_updates(widget, layout=None):
+    """
+    Suspend repaints on a widget while its layout is mutated.
+
+    Qt otherwise runs a relayout and paint pass per addWidget/removeWidget/
+    show/hide call; with updates disabled they coalesce into a single pass
+    when the block exits. Nested use is safe: only the outermost block
+    re-enables updates.
+
+    Args:
+        widget (QWidget): Widget whose subtree is being rearranged
+        layout (QLayout, optional): Layout to activate once on exit
+    """
+    owns_updates = widget.updatesEnabled()
+    if owns_updates:
+        widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        if owns_updates:
+            if layout is not None:
+                layout.activate()
+            widget.setUpdatesEnabled(True)
+            widget.update()
@@ -0,0 +1,43 @@
+"""
+Logging setup for VideoWall.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+LOG_FORMAT = "[%(name)s] %(levelname)s: %(message)s"
+
+
+def setup_logging(level=logging.INFO):
+    """
+    Route all log records through a queue drained by a background thread.
+
+    Records are still formatted on the thread that logs them (QueueHandler
+    does this before enqueueing); only the write() to stderr happens on the
+    listener thread, so slow terminals or pipes never stall the Qt event loop.
+
+    Args:
+        level (int, optional): Root logger level
+
+    Returns:
+        logging.handlers.QueueListener: The running listener, stopped at exit
+    """
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+
+    listener.start()
+    # Flushes whatever is still queued when the interpreter exits
+    atexit.register(listener.stop)
+    return listener
@@ -0,0 +1,136 @@
+"""
+Persistent cache for local video folder scans.
+
+Stores the directory tree seen by the last scan in SQLite, keyed by each
+directory's mtime. A directory's mtime only changes when entries are added,
+removed or renamed in it, so unchanged directories can reuse their cached
+listing without being read again.
+"""
+
+import logging
+import os
+import sqlite3
+
+from src.config.settings import SCAN_CACHE_PATH
+
+logger = logging.getLogger(__name__)
+
+
+class ScanCache:
+    """
+    Directory-listing cache for one scan root, backed by a SQLite file.
+    """
+
+    def __init__(self, root, db_path=SCAN_CACHE_PATH):
+        """
+        Initialize the cache and load any stored listing for the root.
+
+        Args:
+            root (str): Root folder being scanned
+            db_path (str, optional): Path to the SQLite cache file
+        """
+        self.root = os.path.abspath(root)
+        self.db_path = db_path
+        # dir path -> (mtime_ns, files, subdirs) from the previous scan
+        self._cached = {}
+        # dir path -> (mtime_ns, files, subdirs) seen during this scan
+        self._seen = {}
+        self._load()
+
+    def _connect(self):
+        """Open the cache database, creating the schema if needed."""
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "root TEXT, path TEXT, parent TEXT, is_dir INTEGER, mtime INTEGER, "
+            "PRIMARY KEY (root, path))"
+        )
+        return conn
+
+    def _load(self):
+        """Load the stored listing for this root into memory."""
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT path, parent, is_dir, mtime FROM entries WHERE root = ?",
+                    (self.root,),
+                ).fetchall()
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Could not read scan cache: %s", e)
+            return
+
+        mtimes = {}
+        children = {}
+        for path, parent, is_dir, mtime in rows:
+            if is_dir:
+                mtimes[path] = mtime
+            if parent is not None:
+                files, subdirs = children.setdefault(parent, ([], []))
+                (subdirs if is_dir else files).append(path)
+
+        for path, mtime in mtimes.items():
+            files, subdirs = children.get(path, ([], []))
+            self._cached[path] = (mtime, files, subdirs)
+
+    def clear(self):
+        """Forget the stored listing so the next scan re-reads every directory."""
+        self._cached = {}
+
+    def wrap(self, scan_dir):
+        """
+        Wrap a per-directory scan function so unchanged directories skip the read.
+
+        Directories the scan function marks as not cacheable (a failed read, or
+        files that may still be growing) are neither reused nor recorded, so the
+        next scan reads them again.
+
+        Args:
+            scan_dir (callable): Function (path, extensions) -> (files, subdirs, cacheable)
+
+        Returns:
+            callable: Function with the same signature that consults the cache
+        """
+
+        def cached_scan_dir(path, extensions):
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                return scan_dir(path, extensions)
+
+            cached = self._cached.get(path)
+            if cached and cached[0] == mtime:
+                files, subdirs = cached[1], cached[2]
+            else:
+                files, subdirs, cacheable = scan_dir(path, extensions)
+                if not cacheable:
+                    return files, subdirs, False
+            self._seen[path] = (mtime, files, subdirs)
+            return files, subdirs, True
+
+        return cached_scan_dir
+
+    def save(self):
+        """Replace the stored listing for this root with the one seen in this scan."""
+        rows = []
+        for path, (mtime, files, subdirs) in self._seen.items():
+            parent = None if path == self.root else os.path.dirname(path)
+            rows.append((self.root, path, parent, 1, mtime))
+            rows.extend((self.root, f, path, 0, 0) for f in files)
+            # Keep uncached subdirectories listed under their parent; mtime -1
+            # never matches, so they are read again next time
+            rows.extend((self.root, d, path, 1, -1) for d in subdirs if d not in self._seen)
+
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM entries WHERE root = ?", (self.root,))
+                    conn.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", rows)
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Could not write scan cache: %s", e)
@@ -0,0 +1,69 @@
+"""
+Stream validation utilities for VideoWall.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.config.settings import STREAM_PROBE_CONCURRENCY, STREAM_PROBE_TIMEOUT_S
+
+logger = logging.getLogger(__name__)
+
+
+def probe_url(session, url, timeout=STREAM_PROBE_TIMEOUT_S):
+    """
+    Check whether a stream URL is reachable with a HEAD request.
+
+    Args:
+        session (requests.Session): Session used to issue the request
+        url (str): Stream URL to probe
+        timeout (float, optional): Request timeout in seconds
+
+    Returns:
+        bool: True if the server answered without an error status
+    """
+    try:
+        response = session.head(url, timeout=timeout, allow_redirects=True)
+    except requests.RequestException:
+        return False
+    # Some HLS servers reject HEAD outright but are otherwise serving
+    return response.status_code < 400 or response.status_code == 405
+
+
+def validate_urls(urls, concurrency=STREAM_PROBE_CONCURRENCY, stop_event=None):
+    """
+    Probe stream URLs concurrently and keep the reachable ones.
+
+    Requests block on the network, so a bounded thread pool makes total time
+    roughly one timeout rather than one timeout per stream.
+
+    Args:
+        urls (list): Stream URLs to validate
+        concurrency (int, optional): Maximum number of in-flight probes
+        stop_event (threading.Event, optional): Once set, probes not yet sent
+            report their URL unreachable without touching the network
+
+    Returns:
+        list: Reachable URLs, in their original order
+    """
+    if not urls:
+        return []
+
+    def probe(url):
+        if stop_event is not None and stop_event.is_set():
+            return False
+        return probe_url(session, url)
+
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_maxsize=concurrency)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(probe, urls))
+
+    valid = [url for url, ok in zip(urls, results) if ok]
+    logger.info("Stream validation: %d of %d streams reachable.", len(valid), len(urls))
+    return valid